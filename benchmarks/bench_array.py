@@ -0,0 +1,61 @@
+"""
+Construction time and retained memory of large numeric sequences built
+as lists through `construct_from_sequence` and as arrays through
+`construct_array`.
+
+    python benchmarks/bench_array.py [rows] [columns]
+"""
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from io import StringIO
+
+from metaconfig import Config
+
+SOURCE = """--- !declare
+table:
+    type: !resolve {0}
+    load: !resolve {1}
+...
+--- !let
+values: !table
+{2}
+...
+"""
+
+def table(rows, columns):
+    random.seed(0)
+    return "\n".join("    - [{0}]".format(", ".join(
+        repr(round(random.uniform(-1000, 1000), 4)) for column in range(columns)))
+        for row in range(rows))
+
+def load(source):
+    config = Config()
+    config.log = lambda text: None
+    config.load(StringIO(source))
+    return config
+
+def measure(type, constructor, body):
+    source = SOURCE.format(type, constructor, body)
+    gc.collect()
+    start = time.perf_counter()
+    load(source)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    config = load(source)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, current
+
+def main(rows=1000, columns=256):
+    body = table(rows, columns)
+    for name, type, load in (
+            ("lists", "builtins.list", "metaconfig.construct_from_value"),
+            ("arrays", "builtins.list", "metaconfig.construct_array")):
+        elapsed, current = measure(type, load, body)
+        print("{0:>8} {1:8.3f}s {2:8.1f}MB retained".format(name, elapsed, current / 2 ** 20))
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
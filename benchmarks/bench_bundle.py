@@ -0,0 +1,45 @@
+"""
+Wall-clock of `Config.load` from source against `Config.load_compiled` of a
+bundle, with the sources deployed alongside (touched, so every file is
+hashed) and without them, for both loader classes.
+
+    python benchmarks/bench_bundle.py [width] [size]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from metaconfig import Config, Loader, PythonLoader
+
+import trees
+
+def measure(load, loader):
+    config = Config(loader=loader)
+    config.log = lambda text: None
+    start = time.perf_counter()
+    load(config)
+    return time.perf_counter() - start
+
+def main(width=40, size=500):
+    with tempfile.TemporaryDirectory() as root:
+        main = trees.wide_tree(root, width, size)
+        bundle = Path(root, "main.mcb")
+        for loader in (Loader, PythonLoader):
+            config = Config(loader=loader)
+            config.log = lambda text: None
+            bundle.write_bytes(config.compile(main).dumps())
+            print(loader.__name__)
+            print("  source:           {0:.3f}s".format(
+                measure(lambda config: config.load(str(main)), loader)))
+            for path in Path(root).glob("*.yaml"):
+                os.utime(str(path))
+            print("  bundle, sources:  {0:.3f}s".format(
+                measure(lambda config: config.load_compiled(bundle), loader)))
+            print("  bundle only:      {0:.3f}s".format(
+                measure(lambda config: config.load_compiled(bundle, root=Path(root, "missing")),
+                    loader)))
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,85 @@
+"""
+Construction time of many tagged nodes loaded through `construct_from_any`
+and `construct_from_value`, against the previous isinstance chain that
+resolved every scalar and constructed a retagged copy of it.
+
+    python benchmarks/bench_constructors.py [count] [repeat]
+"""
+import sys
+import time
+from io import StringIO
+
+import yaml.nodes
+
+from metaconfig import Config
+from metaconfig.constructors import construct_from_sequence, construct_from_args_kwargs
+
+def previous_scalar(loader, node):
+    tag = loader.resolve(yaml.nodes.ScalarNode, node.value, (True, False))
+    subnode = yaml.nodes.ScalarNode(tag, node.value, node.start_mark, node.end_mark, node.style)
+    return loader.construct_object(subnode, True)
+
+def previous_from_any(cls, loader, node):
+    if isinstance(node, yaml.nodes.ScalarNode):
+        return cls(previous_scalar(loader, node))
+    elif isinstance(node, yaml.nodes.SequenceNode):
+        return construct_from_sequence(cls, loader, node)
+    elif isinstance(node, yaml.nodes.MappingNode):
+        return construct_from_args_kwargs(cls, loader, node)
+    raise ValueError(node)
+
+def previous_from_value(cls, loader, node):
+    if isinstance(node, yaml.nodes.ScalarNode):
+        value = previous_scalar(loader, node)
+    elif isinstance(node, yaml.nodes.SequenceNode):
+        value = loader.construct_sequence(node, True)
+    elif isinstance(node, yaml.nodes.MappingNode):
+        value = loader.construct_mapping(node, True)
+    else:
+        raise ValueError(node)
+    return cls(value)
+
+SOURCE = """--- !declare
+item:
+    type: !resolve metaconfig.tests.utils.identity
+    load: !resolve {0}
+...
+--- !let
+items:
+{1}
+...
+"""
+
+def items(count):
+    kinds = ("{0}", "{0}.5", "name{0}", "true", "[{0}, {0}]")
+    return "\n".join("    - !item " + kinds[index % len(kinds)].format(index % 100)
+        for index in range(count))
+
+def load(source):
+    config = Config()
+    config.log = lambda text: None
+    config.load(StringIO(source))
+    return config
+
+def measure(constructor, body, repeat):
+    source = SOURCE.format(constructor, body)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load(source)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main(count=100000, repeat=3):
+    body = items(count)
+    for name, constructor in (
+            ("any, previous", "__main__.previous_from_any"),
+            ("any", "metaconfig.construct_from_any"),
+            ("value, previous", "__main__.previous_from_value"),
+            ("value", "metaconfig.construct_from_value")):
+        elapsed = measure(constructor, body, repeat)
+        print("{0:>16} {1:8.3f}s {2:8.2f}us/node".format(name, elapsed, elapsed / count * 1e6))
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
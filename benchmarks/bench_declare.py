@@ -0,0 +1,37 @@
+"""
+Per-file overhead of including a file that `!load`s a growing table of
+`!declare`d types.
+
+    python benchmarks/bench_declare.py [files]
+"""
+import sys
+import tempfile
+import time
+
+from metaconfig import Config
+
+import trees
+
+def measure(path, repeat=3):
+    best = None
+    for _ in range(repeat):
+        config = Config()
+        config.log = lambda text: None
+        start = time.perf_counter()
+        config.load(str(path))
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main(files=200):
+    print("{0:>8} {1:>12} {2:>14}".format("types", "types.yaml", "per file"))
+    for types in (10, 100, 1000, 5000):
+        with tempfile.TemporaryDirectory() as root:
+            main = trees.declared_tree(root, types, files)
+            declare = measure(main.with_name("types.yaml"))
+            total = measure(main)
+            per_file = (total - declare) / files
+            print("{0:>8} {1:>11.3f}s {2:>12.1f}us".format(types, declare, per_file * 1e6))
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
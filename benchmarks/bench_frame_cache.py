@@ -0,0 +1,51 @@
+"""
+Tenants whose roots all include the same common tree, loaded into one
+`Config` each with and without a shared `FrameCache`.
+
+    python benchmarks/bench_frame_cache.py [tenants] [width] [size]
+"""
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from metaconfig import Config, FrameCache
+
+import trees
+
+def load(roots, frame_cache):
+    configs = []
+    for root in roots:
+        config = Config(frame_cache=frame_cache)
+        config.log = lambda text: None
+        config.load(str(root))
+        configs.append(config)
+    return configs
+
+def measure(roots, frame_cache):
+    gc.collect()
+    start = time.perf_counter()
+    load(roots, frame_cache() if frame_cache else None)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    cache = frame_cache() if frame_cache else None
+    configs = load(roots, cache)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, current, cache
+
+def main(tenants=20, width=10, size=200):
+    with tempfile.TemporaryDirectory() as root:
+        trees.wide_tree(root + "/common", width, size)
+        roots = [trees.write(root, "tenant{0}.yaml".format(index),
+            "--- !load common/main.yaml\n--- !let\ntenant: {0}\n...\n".format(index))
+            for index in range(tenants)]
+        elapsed, current, _ = measure(roots, None)
+        print("separate: {0:8.3f}s {1:8.1f}MB".format(elapsed, current / 2 ** 20))
+        elapsed, current, cache = measure(roots, lambda: FrameCache(max_bytes=256 * 2 ** 20))
+        print("shared:   {0:8.3f}s {1:8.1f}MB {2}".format(
+            elapsed, current / 2 ** 20, cache.stats()))
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
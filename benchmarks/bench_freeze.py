@@ -0,0 +1,79 @@
+"""
+Memory a forked worker stops sharing with its parent by collecting
+garbage, then by reading every value of a large config, loaded as is, frozen
+with `Config.freeze()`, frozen with `gc_freeze=True` and frozen that way
+with an `Interner`. Each variant runs
+in a fresh interpreter, as `gc.freeze` affects the whole process. Linux
+only, the private dirty size is read from /proc/self/smaps_rollup.
+
+    python benchmarks/bench_freeze.py [records]
+"""
+import gc
+import os
+import subprocess
+import sys
+import time
+from io import StringIO
+
+from metaconfig import Config, Interner
+
+def source(records):
+    lines = ["--- !let", "routes:"]
+    for index in range(records):
+        lines.append("    - {{path: /api/{0}, backend: pool{1}, ports: [{2}, {3}], "
+            "weight: 1.5, tags: [a, b]}}".format(index, index % 16, 8000 + index % 100, index))
+    lines.append("...")
+    return "\n".join(lines) + "\n"
+
+def private_dirty():
+    with open("/proc/self/smaps_rollup") as stream:
+        for line in stream:
+            if line.startswith("Private_Dirty:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+def walk(value):
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            walk(item)
+    elif hasattr(value, "items"):
+        for key, item in value.items():
+            walk(item)
+
+def worker(config):
+    before = private_dirty()
+    gc.collect()
+    collected = private_dirty()
+    walk(config.get("routes"))
+    return collected - before, private_dirty() - collected
+
+def run(variant, records):
+    config = Config(interner=Interner() if variant == "interned" else None)
+    config.log = lambda text: None
+    config.load(StringIO(source(records)))
+    start = time.perf_counter()
+    if variant != "plain":
+        config.freeze(gc_freeze=variant != "freeze")
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.write(write, "{0} {1}".format(*worker(config)).encode())
+        os._exit(0)
+    os.close(write)
+    collected, walked = map(int, os.read(read, 64).split())
+    os.waitpid(pid, 0)
+    print("{0:>10} {1:8.3f}s freeze, worker copies {2:8.1f}MB collecting, "
+        "{3:8.1f}MB more reading everything".format(
+        variant, elapsed, collected / 2 ** 20, walked / 2 ** 20))
+
+def main(records=100000):
+    for variant in ("plain", "freeze", "gc_freeze", "interned"):
+        subprocess.check_call([sys.executable, __file__, variant, str(records)])
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        run(sys.argv[1], int(sys.argv[2]))
+    else:
+        main(*map(int, sys.argv[1:]))
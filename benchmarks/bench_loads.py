@@ -0,0 +1,39 @@
+"""
+Time of `Config.load` called once per file for a growing number of small
+files, each declaring a type and binding a value of it, which should grow
+about linearly with the number of files.
+
+    python benchmarks/bench_loads.py
+"""
+import tempfile
+import time
+
+from metaconfig import Config
+
+import trees
+
+SOURCE = """--- !declare
+type{0}:
+    type: !resolve builtins.dict
+    load: !resolve metaconfig.construct_from_mapping
+--- !let
+value{0}: !type{0} {{index: {0}}}
+...
+"""
+
+def main():
+    print("{0:>8} {1:>10} {2:>12}".format("files", "total", "per file"))
+    for files in (250, 500, 1000, 2000):
+        with tempfile.TemporaryDirectory() as root:
+            paths = [str(trees.write(root, "file{0}.yaml".format(index), SOURCE.format(index)))
+                for index in range(files)]
+            config = Config()
+            config.log = lambda text: None
+            start = time.perf_counter()
+            for path in paths:
+                config.load(path)
+            elapsed = time.perf_counter() - start
+            print("{0:>8} {1:>9.3f}s {2:>10.1f}us".format(files, elapsed, elapsed / files * 1e6))
+
+if __name__ == "__main__":
+    main()
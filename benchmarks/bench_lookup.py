@@ -0,0 +1,69 @@
+"""
+Deep lookups into a loaded config: walking the nested mappings by hand
+for every lookup against `Config.lookup`, plus the cost of the first
+lookup of each path and of recording marks for `Config.where`.
+
+    python benchmarks/bench_lookup.py [services] [lookups]
+"""
+import sys
+import time
+from io import StringIO
+
+from metaconfig import Config
+
+def source(services):
+    lines = ["--- !let", "services:"]
+    for index in range(services):
+        lines.extend([
+            "    service{0}:".format(index),
+            "        db:",
+            "            host: db{0}.local".format(index),
+            "            pool: {{size: {0}, timeout: 30}}".format(index % 50),
+            "        replicas: [a, b, c]",
+        ])
+    lines.append("...")
+    return "\n".join(lines) + "\n"
+
+def load(text, marks=False):
+    config = Config(marks=marks)
+    config.log = lambda text: None
+    start = time.perf_counter()
+    config.load(StringIO(text))
+    return config, time.perf_counter() - start
+
+def walk(config, path):
+    names = path.split(".")
+    value = config.get(names[0])
+    for name in names[1:]:
+        value = value[int(name)] if isinstance(value, list) else value[name]
+    return value
+
+def main(services=2000, lookups=1000000):
+    text = source(services)
+    config, plain = load(text)
+    _, marked = load(text, marks=True)
+    paths = ["services.service{0}.db.pool.size".format(index % services)
+        for index in range(lookups)]
+
+    start = time.perf_counter()
+    for path in paths:
+        walk(config, path)
+    walked = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for path in paths[:services]:
+        config.lookup(path)
+    first = time.perf_counter() - start
+    lookup = config.lookup
+    start = time.perf_counter()
+    for path in paths:
+        lookup(path)
+    looked = time.perf_counter() - start
+
+    print("load {0:.3f}s, with marks {1:.3f}s, first lookups {2:.3f}s".format(
+        plain, marked, first))
+    print("{0:>8} {1:8.3f}s {2:8.0f} lookups/s".format("walk", walked, lookups / walked))
+    print("{0:>8} {1:8.3f}s {2:8.0f} lookups/s".format("lookup", looked, lookups / looked))
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,50 @@
+"""
+Memory held by a large config of identically shaped records, loaded with
+plain dicts, OrderedDict and CompactMapping, with and without an Interner.
+
+    python benchmarks/bench_mappings.py [records]
+"""
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import OrderedDict
+
+from metaconfig import Config, CompactMapping, Interner
+
+import trees
+
+def routes(root, records):
+    lines = ["--- !let", "routes:"]
+    for index in range(records):
+        lines.append("    - {{path: /api/{0}, backend: pool{1}, port: {2}, weight: 1, "
+            "timeout: 30, retries: 3}}".format(index, index % 16, 8000 + index % 100))
+    lines.append("...")
+    return trees.write(root, "routes.yaml", "\n".join(lines) + "\n")
+
+def measure(path, mapping, interner=None):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    config = Config(mapping=mapping, interner=interner)
+    config.log = lambda text: None
+    config.load(str(path))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, elapsed
+
+def main(records=50000):
+    with tempfile.TemporaryDirectory() as root:
+        path = routes(root, records)
+        for mapping in (OrderedDict, dict, CompactMapping):
+            for interner in (None, Interner()):
+                current, elapsed = measure(path, mapping, interner)
+                print("{0:>16} {1:>9} {2:10.1f}MB retained {3:8.3f}s".format(
+                    mapping.__name__, "interned" if interner else "",
+                    current / 2 ** 20, elapsed))
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,47 @@
+"""
+Peak RSS and wall-clock of loading one large file through `open_file`
+against `Config(memory_map=True)`. Every mode runs in a fresh process so
+peak RSS is not shared between them.
+
+    python benchmarks/bench_mmap.py [megabytes]
+"""
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from metaconfig import Config
+
+def generate(path, megabytes):
+    line = "    - {{name: item{0:08d}, payload: {1}}}\n"
+    with path.open("w", encoding="utf-8") as stream:
+        stream.write("--- !let\nitems:\n")
+        index = 0
+        while stream.tell() < megabytes * 2 ** 20:
+            stream.write(line.format(index, "x" * 200))
+            index += 1
+        stream.write("...\n")
+
+def child(path, memory_map):
+    config = Config(memory_map=memory_map == "mmap")
+    config.log = lambda text: None
+    start = time.perf_counter()
+    config.load(path)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print("{0:>6} {1:8.3f}s {2:10.1f}MB peak RSS".format(memory_map, elapsed, peak))
+
+def main(megabytes=100):
+    with tempfile.TemporaryDirectory() as root:
+        path = Path(root, "large.yaml")
+        generate(path, megabytes)
+        for mode in ("text", "mmap"):
+            subprocess.run([sys.executable, __file__, "--child", str(path), mode], check=True)
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(*sys.argv[2:])
+    else:
+        main(*map(int, sys.argv[1:]))
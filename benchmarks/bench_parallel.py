@@ -0,0 +1,37 @@
+"""
+Wall-clock of serial `Config.load` against `Config.load_parallel` on a wide
+include tree.
+
+    python benchmarks/bench_parallel.py [width] [size]
+"""
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from metaconfig import Config
+
+import trees
+
+def measure(load):
+    config = Config()
+    config.log = lambda text: None
+    start = time.perf_counter()
+    load(config)
+    return time.perf_counter() - start
+
+def main(width=40, size=500):
+    with tempfile.TemporaryDirectory() as root:
+        main = str(trees.wide_tree(root, width, size))
+        serial = measure(lambda config: config.load(main))
+        print("serial:           {0:.3f}s".format(serial))
+        with ThreadPoolExecutor() as executor:
+            threads = measure(lambda config: config.load_parallel(main, executor))
+        print("thread pool:      {0:.3f}s".format(threads))
+        with ProcessPoolExecutor() as executor:
+            executor.submit(int).result()
+            processes = measure(lambda config: config.load_parallel(main, executor))
+        print("process pool:     {0:.3f}s".format(processes))
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,69 @@
+"""
+Load time, retained memory and field access time of many records loaded
+as plain dicts, as CompactMapping and as `!declare` records with `fields`.
+
+    python benchmarks/bench_records.py [records]
+"""
+import gc
+import sys
+import time
+import tracemalloc
+from io import StringIO
+
+from metaconfig import Config, CompactMapping
+
+DECLARE = """--- !declare
+route:
+    fields: [path, backend, port, weight, timeout]
+...
+"""
+
+def source(records, tag):
+    lines = ["--- !let", "routes:"]
+    for index in range(records):
+        lines.append("    - {0} {{path: /api/{1}, backend: pool{2}, port: {3}, weight: 1, "
+            "timeout: 30}}".format(tag, index, index % 16, 8000 + index % 100))
+    lines.append("...")
+    return "\n".join(lines) + "\n"
+
+def load(text, mapping=None):
+    config = Config(mapping=mapping)
+    config.log = lambda text: None
+    config.load(StringIO(text))
+    return config
+
+def access(routes, item):
+    start = time.perf_counter()
+    total = 0
+    for _ in range(10):
+        if item:
+            for route in routes:
+                total += route["port"] + route["timeout"]
+        else:
+            for route in routes:
+                total += route.port + route.timeout
+    return time.perf_counter() - start
+
+def measure(text, mapping=None, item=True):
+    gc.collect()
+    start = time.perf_counter()
+    load(text, mapping)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    config = load(text, mapping)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, current, access(config.get("routes"), item)
+
+def main(records=50000):
+    plain = source(records, "")
+    for name, text, mapping, item in (
+            ("dict", plain, None, True),
+            ("CompactMapping", plain, CompactMapping, True),
+            ("record", DECLARE + source(records, "!route"), None, False)):
+        elapsed, current, seconds = measure(text, mapping, item)
+        print("{0:>15} {1:8.3f}s {2:8.1f}MB retained {3:8.3f}s access".format(
+            name, elapsed, current / 2 ** 20, seconds))
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,66 @@
+"""
+Load time of a config of many records without validation, validated by
+walking the loaded values afterwards, and validated during construction
+by a schema declared with `Config.add_schema`.
+
+    python benchmarks/bench_schema.py [records] [repeat]
+"""
+import sys
+import time
+from io import StringIO
+
+from metaconfig import Config, compile_schema
+
+SPEC = {
+    "path": "str",
+    "backend": "str",
+    "port": "int",
+    "weight": "int|float",
+    "tags?": ["str"],
+}
+
+def source(records, tag):
+    lines = ["--- !let", "routes: {0}".format(tag)]
+    for index in range(records):
+        lines.append("    - {{path: /api/{0}, backend: pool{1}, port: {2}, weight: 1.5, "
+            "tags: [a, b]}}".format(index, index % 16, 8000 + index % 100))
+    lines.append("...")
+    return "\n".join(lines) + "\n"
+
+def load(text, schema=False):
+    config = Config()
+    config.log = lambda text: None
+    if schema:
+        config.add_schema("routes", [SPEC])
+    config.load(StringIO(text))
+    return config
+
+def walk(routes):
+    # What validating by hand after every load looks like.
+    for route in routes:
+        assert set(route) <= set(["path", "backend", "port", "weight", "tags"])
+        assert isinstance(route["path"], str) and isinstance(route["backend"], str)
+        assert isinstance(route["port"], int) and not isinstance(route["port"], bool)
+        assert isinstance(route["weight"], (int, float))
+        assert all(isinstance(tag, str) for tag in route.get("tags", ()))
+
+def best(run, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main(records=50000, repeat=3):
+    plain, tagged = source(records, ""), source(records, "!routes")
+    schema = compile_schema([SPEC])
+    for name, run in (
+            ("unvalidated", lambda: load(plain)),
+            ("walked", lambda: walk(load(plain).get("routes"))),
+            ("validate()", lambda: schema.validate(load(plain).get("routes"))),
+            ("schema", lambda: load(tagged, schema=True))):
+        print("{0:>12} {1:8.3f}s".format(name, best(run, repeat)))
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
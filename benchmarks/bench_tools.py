@@ -0,0 +1,55 @@
+"""
+Calls per second of a `tools` expression tree evaluated through the
+recursive `Primitive.__call__` and through a compiled `Evaluator`, and of
+`Try` against `AdaptiveTry` when the first alternative always fails.
+
+    python benchmarks/bench_tools.py [width] [calls]
+"""
+import operator
+import sys
+import time
+
+from metaconfig.tools import Constant, Function, Try, AdaptiveTry
+
+def tree(width):
+    """
+    Sum of `width` terms, each scaling a request-time value by a factor
+    computed from constants only, with a fallback for a failing lookup.
+    """
+    values = {"base": 3}
+    terms = []
+    for index in range(width):
+        factor = Function(operator.mul, Constant(index), Function(abs, Constant(-2), pure=True),
+            pure=True)
+        lookup = Try(Function(values.__getitem__, Constant("missing")),
+            Function(values.__getitem__, Constant("base")))
+        terms.append(Function(operator.mul, factor, lookup))
+    total = terms[0]
+    for term in terms[1:]:
+        total = Function(operator.add, total, term)
+    return total
+
+def measure(call, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return calls / (time.perf_counter() - start)
+
+def main(width=50, calls=2000):
+    root = tree(width)
+    assert root() == root.compile()()
+    print("recursive: {0:10.0f} calls/s".format(measure(root, calls)))
+    print("compiled:  {0:10.0f} calls/s".format(measure(root.compile(), calls)))
+
+    def accelerated():
+        from _metaconfig_speedups import evaluate
+        return evaluate()
+    fallback = lambda: 1
+    for name, node in (
+            ("try:", Try(accelerated, fallback)),
+            ("adaptive:", AdaptiveTry(accelerated, fallback)),
+            ("pinned:", AdaptiveTry(accelerated, fallback, pin_after=10))):
+        print("{0:10} {1:10.0f} calls/s".format(name, measure(node, calls * 10)))
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,119 @@
+"""
+Reproducible benchmark suite for `Config.load`.
+
+Generates synthetic config trees, loads each of them with the libyaml
+based `Loader` (when available) and the pure Python `PythonLoader`, and
+reports wall-clock time, peak traced memory and the number of memory
+blocks left allocated by the load, as JSON.
+
+    python benchmarks/suite.py [--repeat N] [--output results.json] [case ...]
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import yaml
+
+import metaconfig
+from metaconfig import Config, Loader, PythonLoader
+
+import trees
+
+CASES = {
+    "deep": lambda root: trees.deep_chain(root, 50, 20),
+    "wide": lambda root: trees.wide_tree(root, 50, 20),
+    "declare": lambda root: trees.declared_tree(root, 1000, 50),
+    "let": lambda root: trees.large_let(root, 5000),
+    "documents": lambda root: trees.multi_document(root, 500, 10),
+}
+
+LOADERS = {
+    "python": PythonLoader,
+}
+
+if yaml.__with_libyaml__:
+    LOADERS["libyaml"] = Loader
+
+def load(path, loader):
+    config = Config(loader=loader)
+    config.log = lambda text: None
+    config.load(str(path))
+    return config
+
+def measure_time(path, loader, repeat):
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        load(path, loader)
+        timings.append(time.perf_counter() - start)
+    return min(timings), sum(timings) / len(timings)
+
+def measure_memory(path, loader):
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        config = load(path, loader)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    gc.collect()
+    retained = sys.getallocatedblocks() - blocks
+    del config
+    return peak, retained
+
+def run(cases, repeat):
+    results = []
+    for case in cases:
+        with tempfile.TemporaryDirectory() as root:
+            path = CASES[case](root)
+            for name, loader in sorted(LOADERS.items()):
+                best, mean = measure_time(path, loader, repeat)
+                peak, retained = measure_memory(path, loader)
+                results.append({
+                    "case": case,
+                    "loader": name,
+                    "best_seconds": best,
+                    "mean_seconds": mean,
+                    "peak_bytes": peak,
+                    "retained_blocks": retained,
+                })
+                print("{0:>10} {1:>8} {2:9.3f}s {3:12d}B {4:10d} blocks".format(
+                    case, name, best, peak, retained), file=sys.stderr)
+    return {
+        "metaconfig": metaconfig.__version__,
+        "python": platform.python_version(),
+        "pyyaml": yaml.__version__,
+        "libyaml": yaml.__with_libyaml__,
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("cases", nargs="*", metavar="case",
+        help="one of {0}, all by default".format(", ".join(sorted(CASES))))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="-")
+    args = parser.parse_args(argv)
+    for case in args.cases:
+        if case not in CASES:
+            parser.error("unknown case {0!r}".format(case))
+    report = run(args.cases or sorted(CASES), args.repeat)
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, "w") as stream:
+            json.dump(report, stream, indent=2)
+
+if __name__ == "__main__":
+    main()
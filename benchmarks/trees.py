@@ -0,0 +1,77 @@
+"""
+Generators of synthetic config trees used by the benchmarks.
+"""
+from pathlib import Path
+
+def write(root, name, source):
+    path = Path(root).joinpath(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(source, encoding="utf-8")
+    return path
+
+def mapping(prefix, size):
+    lines = ["--- !let"]
+    for index in range(size):
+        lines.append("{0}_{1}:".format(prefix, index))
+        lines.append("    name: item {0}".format(index))
+        lines.append("    weight: {0}.5".format(index))
+        lines.append("    tags: [a, b, c]")
+        lines.append("    enabled: true")
+    lines.append("...")
+    return "\n".join(lines) + "\n"
+
+def wide_tree(root, width, size):
+    """
+    `main.yaml` including `width` independent leaves of `size` bindings each.
+    """
+    for index in range(width):
+        write(root, "leaf{0}.yaml".format(index), mapping("leaf{0}".format(index), size))
+    includes = ["--- !load leaf{0}.yaml".format(index) for index in range(width)]
+    return write(root, "main.yaml", "\n".join(includes) + "\n")
+
+def declared_tree(root, types, files):
+    """
+    `types.yaml` declaring `types` tags, included by `files` files each using
+    one of them, all of which are included by `main.yaml`.
+    """
+    lines = ["--- !declare"]
+    for index in range(types):
+        lines.append("type{0}:".format(index))
+        lines.append("    type: !resolve builtins.tuple")
+        lines.append("    load: !resolve metaconfig.construct_from_value")
+    lines.append("...")
+    write(root, "types.yaml", "\n".join(lines) + "\n")
+    for index in range(files):
+        write(root, "file{0}.yaml".format(index), "\n".join([
+            "--- !load types.yaml",
+            "--- !let",
+            "value{0}: !type{1} [1, 2]".format(index, index % types),
+            "...",
+            ]) + "\n")
+    includes = ["--- !load file{0}.yaml".format(index) for index in range(files)]
+    return write(root, "main.yaml", "\n".join(includes) + "\n")
+
+def deep_chain(root, depth, size):
+    """
+    `main.yaml` at the top of a chain of `depth` files each including the
+    next one and binding `size` values.
+    """
+    for index in range(depth):
+        source = mapping("level{0}".format(index), size)
+        if index + 1 < depth:
+            source = "--- !load level{0}.yaml\n".format(index + 1) + source
+        write(root, "level{0}.yaml".format(index), source)
+    return write(root, "main.yaml", "--- !load level0.yaml\n")
+
+def large_let(root, size):
+    """
+    `main.yaml` holding a single `!let` document of `size` bindings.
+    """
+    return write(root, "main.yaml", mapping("value", size))
+
+def multi_document(root, documents, size):
+    """
+    `main.yaml` holding `documents` `!let` documents of `size` bindings.
+    """
+    source = "".join(mapping("doc{0}".format(index), size) for index in range(documents))
+    return write(root, "main.yaml", source)
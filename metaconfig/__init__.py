@@ -1,11 +1,51 @@
-# This relies on each of the submodules having an __all__ variable.
+# Public names are listed here with the submodule defining them, which is
+# only imported on first access (PEP 562), so that `import metaconfig`
+# stays cheap and asyncio, multiprocessing or yaml are only loaded by the
+# parts using them. Each submodule's __all__ must match its entries.
 
-from .core import *
-from .constructors import *
+from importlib import import_module
 
-__all__ = (['__version__']
-    + core.__all__
-    + constructors.__all__
-    )
+_EXPORTS = {
+    'core': ['Config', 'Loader', 'PythonLoader'],
+    'constructors': [
+        'construct_from_mapping',
+        'construct_from_sequence',
+        'construct_from_string',
+        'construct_from_integer',
+        'construct_from_any',
+        'construct_from_none',
+        'construct_from_value',
+        'construct_from_args_kwargs',
+        'construct_array',
+        'construct_record',
+    ],
+    'mappings': ['CompactMapping'],
+    'records': ['Record', 'record_type'],
+    'bundle': ['Bundle'],
+    'interning': ['Interner'],
+    'schema': ['Schema', 'SchemaError', 'compile_schema'],
+    'resolver': ['Resolver', 'LazyObject', 'default_resolver'],
+    'cache': ['NodeCache', 'FrameCache', 'default_frame_cache'],
+    'metrics': ['LoadMetrics'],
+    'aio': ['AsyncConfig'],
+    'watch': ['ConfigWatcher'],
+}
+
+_MODULES = dict((name, module) for module, names in _EXPORTS.items() for name in names)
+
+__all__ = ['__version__'] + [name for names in _EXPORTS.values() for name in names]
 
 __version__ = '0.3.0'
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return import_module("." + name, __name__)
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+    value = getattr(import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
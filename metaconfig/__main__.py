@@ -0,0 +1,47 @@
+"""
+    python -m metaconfig compile root.yaml [-o bundle.mcb]
+    python -m metaconfig info bundle.mcb
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from .core import Config
+from .bundle import Bundle
+
+def compile_command(args):
+    config = Config()
+    config.log = lambda text: None
+    bundle = config.compile(args.root)
+    output = Path(args.output or Path(args.root).with_suffix(".mcb"))
+    data = bundle.dumps()
+    output.write_bytes(data)
+    print("Compiled {0} files into {1} ({2} bytes)".format(
+        len(bundle.files), output, len(data)))
+
+def info_command(args):
+    bundle = Bundle.loads(Path(args.bundle).read_bytes())
+    print("root: {0}".format(bundle.root))
+    for relative, signature, digest, dumped in bundle.files:
+        print("file: {0} {1} {2} bytes".format(relative, digest[:12], len(dumped)))
+    for dotted in bundle.resolves:
+        print("resolve: {0}".format(dotted))
+    for name in bundle.declares:
+        print("declare: {0}".format(name))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m metaconfig")
+    commands = parser.add_subparsers(dest="command", required=True)
+    command = commands.add_parser("compile",
+        help="bake a config tree into a single bundle for Config.load_compiled")
+    command.add_argument("root")
+    command.add_argument("-o", "--output", help="defaults to the root with an .mcb suffix")
+    command.set_defaults(handler=compile_command)
+    command = commands.add_parser("info", help="describe a compiled bundle")
+    command.add_argument("bundle")
+    command.set_defaults(handler=info_command)
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
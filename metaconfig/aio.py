@@ -0,0 +1,63 @@
+import asyncio
+
+from .core import Config, _compose, _digest, _scan_scalars
+
+__all__ = [
+    'AsyncConfig',
+]
+
+class AsyncConfig(Config):
+    """
+    Config loading files without blocking the event loop.
+
+    Files are read through `read_file`, composed on `executor` and every
+    `!load` target of a file is fetched concurrently. Construction then
+    runs on the loop in declaration order, exactly as `Config.load` does.
+    """
+    def __init__(self, *args, executor=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._executor = executor
+
+    def _read_file(self, path):
+        with self.open_file(path) as stream:
+            return stream.read()
+
+    async def read_file(self, path):
+        """
+        Returns the text of `path`. Runs `open_file` on the executor by
+        default, override it to plug in a native asynchronous reader.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._read_file, path)
+
+    async def aprefetch(self, filename):
+        loop = asyncio.get_running_loop()
+        tag = "!" + self._names["load"]
+        seen = set()
+
+        async def fetch(path):
+            if path in seen or self.get_frame(path) is not None:
+                return
+            seen.add(path)
+            signature = self.file_signature(path)
+            source = await self.read_file(path)
+            if self._cache is not None:
+                key, nodes = self._cache.fetch(source, str(path), self._loader)
+            else:
+                key, nodes = None, None
+            if nodes is None:
+                nodes = await loop.run_in_executor(self._executor,
+                    _compose, source, str(path), self._loader)
+                if key is not None:
+                    self._cache.put(key, nodes)
+            self._prefetched[path] = (signature, _digest(source), nodes)
+            if tag in source:
+                includes = [self._get_include_path(relative, path)
+                    for relative in _scan_scalars(nodes, tag)]
+                await asyncio.gather(*map(fetch, includes))
+
+        await fetch(self.get_path(filename))
+
+    async def aload(self, filename):
+        await self.aprefetch(filename)
+        return self.load(filename)
@@ -0,0 +1,61 @@
+"""
+Single file format for config trees compiled by `Config.compile`.
+
+A bundle is a magic header, the sha256 digest of the payload and the
+payload itself: a marshal dump of the root file, the `serialize`d node
+graph of every file with the signature and digest of its source, and the
+dotted names and type names the tree `!resolve`s and `!declare`s.
+"""
+import hashlib
+import marshal
+
+from .serialize import dump_nodes, load_nodes
+
+__all__ = [
+    'Bundle',
+]
+
+MAGIC = b"MCB\x01"
+VERSION = 1
+
+class Bundle(object):
+    """
+    Contents of a bundle. `files` holds `(relative path, signature, digest,
+    nodes)` entries, paths relative to the directory of `root` and nodes
+    as `dump_nodes` bytes, decoded by `nodes` on demand.
+    """
+    def __init__(self, root, files=(), resolves=(), declares=()):
+        self.root = root
+        self.files = list(files)
+        self.resolves = list(resolves)
+        self.declares = list(declares)
+
+    def dumps(self):
+        payload = marshal.dumps(
+            (VERSION, self.root, self.files, self.resolves, self.declares))
+        return MAGIC + hashlib.sha256(payload).digest() + payload
+
+    @classmethod
+    def loads(cls, data):
+        """
+        Raises `ValueError` on data that is not a bundle of this version or
+        fails the checksum.
+        """
+        data = memoryview(data)
+        if bytes(data[:len(MAGIC)]) != MAGIC:
+            raise ValueError("Not a compiled config bundle")
+        checksum = bytes(data[len(MAGIC):len(MAGIC) + 32])
+        payload = data[len(MAGIC) + 32:]
+        if hashlib.sha256(payload).digest() != checksum:
+            raise ValueError("Compiled config bundle is corrupted")
+        version, root, files, resolves, declares = marshal.loads(payload)
+        if version != VERSION:
+            raise ValueError("Unsupported compiled config bundle version {0}".format(version))
+        return cls(root, files, resolves, declares)
+
+    def add(self, relative, signature, digest, nodes):
+        self.files.append((relative, signature, digest, dump_nodes(nodes)))
+
+    @staticmethod
+    def nodes(dumped, filename):
+        return load_nodes(dumped, filename)
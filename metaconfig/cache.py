@@ -0,0 +1,199 @@
+from collections import OrderedDict
+import hashlib
+import os
+import sys
+import threading
+from pathlib import Path
+
+import yaml
+
+from .core import _compose
+from .mappings import CompactMapping
+from .serialize import dump_nodes, load_nodes
+
+__all__ = [
+    'NodeCache',
+    'FrameCache',
+    'default_frame_cache',
+]
+
+class NodeCache(object):
+    """
+    On-disk cache of composed YAML documents keyed by a digest of the source.
+
+    Only the node graph produced by the composer is stored, construction
+    (`!declare`, `!let`, `!load` and friends) still runs on every load, so
+    each included file is validated against its own content and changes
+    propagate through the include tree without extra bookkeeping.
+    """
+    version = 2
+
+    def __init__(self, directory):
+        self._directory = Path(directory)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def key(self, source, loader):
+        digest = hashlib.sha256()
+        header = "{0}:{1}:{2}.{3}\n".format(
+            self.version, yaml.__version__, loader.__module__, loader.__qualname__)
+        digest.update(header.encode("utf-8"))
+        digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_path(self, key):
+        return self._directory.joinpath(key[:2], key)
+
+    def get(self, key, filename):
+        try:
+            data = self.get_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            return load_nodes(data, filename)
+        except (EOFError, ValueError, TypeError, IndexError, KeyError):
+            return None
+
+    def put(self, key, nodes):
+        path = self.get_path(key)
+        import tempfile
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as stream:
+                stream.write(dump_nodes(nodes))
+            os.replace(temp, str(path))
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+    def fetch(self, source, filename, loader):
+        key = self.key(source, loader)
+        nodes = self.get(key, filename)
+        if nodes is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return key, nodes
+
+    def compose(self, source, filename, loader):
+        key, nodes = self.fetch(source, filename, loader)
+        if nodes is not None:
+            return nodes
+        nodes = _compose(source, filename, loader)
+        self.put(key, nodes)
+        return nodes
+
+_CONTAINERS = (list, tuple, set, frozenset)
+
+def deep_sizeof(value):
+    """
+    Approximate size in bytes of `value` and the containers, strings and
+    numbers it reaches, each object counted once. Other objects are
+    counted shallowly.
+    """
+    seen = set()
+    size = 0
+    pending = [value]
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, _CONTAINERS):
+            pending.extend(item)
+        elif isinstance(item, CompactMapping):
+            pending.append(item._values)
+    return size
+
+def frame_sizeof(frame):
+    return deep_sizeof((frame.data, frame.dependencies))
+
+class FrameCache(object):
+    """
+    Thread-safe LRU of constructed frames shared between `Config`s.
+
+    Entries are keyed by path, content digest, tag names and the options
+    affecting construction, and hold the frame with the paths, signatures
+    and digests of every file it includes, which a `Config` checks before
+    adopting it. Entries are evicted least recently used first once their
+    estimated size exceeds `max_bytes`.
+
+    Configs adopting a frame share its data, which must not be mutated.
+    Frames with lazy bindings still to `!load` an include are not shared.
+    """
+    def __init__(self, max_bytes=64 * 2 ** 20, sizeof=frame_sizeof):
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_bytes(self):
+        return self._max_bytes
+
+    def get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def peek(self, key):
+        """
+        Like `get`, without counting or refreshing the entry.
+        """
+        with self._lock:
+            item = self._entries.get(key)
+            return None if item is None else item[0]
+
+    def put(self, key, frame, includes):
+        size = self._sizeof(frame)
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = ((frame, includes), size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+default_frame_cache = FrameCache()
@@ -1,5 +1,11 @@
+from array import array
+from types import GeneratorType
+import re
+
 import yaml.nodes
 
+from .resolver import LazyObject
+
 __all__ = [
     'construct_from_mapping',
     'construct_from_sequence',
@@ -9,6 +15,8 @@ __all__ = [
     'construct_from_none',
     'construct_from_value',
     'construct_from_args_kwargs',
+    'construct_array',
+    'construct_record',
 ]
 
 def construct_from_mapping(cls, loader, node):
@@ -27,40 +35,182 @@ def construct_from_integer(cls, loader, node):
     scalar = int(loader.construct_scalar(node))
     return cls(scalar)
 
+# Implicit tags of plain scalar texts per resolver class, dropped as a
+# whole when full so that configs of unique strings can not grow it.
+_implicit_tags = {}
+_IMPLICIT_TAGS_LIMIT = 65536
+
+def _resolve_implicit(loader, value):
+    if loader.yaml_path_resolvers:
+        return loader.resolve(yaml.nodes.ScalarNode, value, (True, False))
+    tags = _implicit_tags.get(type(loader))
+    if tags is None:
+        tags = _implicit_tags.setdefault(type(loader), {})
+    tag = tags.get(value)
+    if tag is None:
+        if len(tags) >= _IMPLICIT_TAGS_LIMIT:
+            tags.clear()
+        tag = tags[value] = loader.resolve(yaml.nodes.ScalarNode, value, (True, False))
+    return tag
+
+def _construct_scalar_value(loader, node):
+    """
+    Value of a tagged scalar as if it was written untagged. The constructor
+    of the implicit tag is called on the node itself, unless it is missing
+    or a generator, instead of constructing a retagged copy.
+    """
+    tag = _resolve_implicit(loader, node.value)
+    constructors = loader.yaml_constructors
+    if tag in constructors:
+        value = constructors[tag](loader, node)
+        if type(value) is not GeneratorType:
+            interner = getattr(loader, "_interner", None)
+            return value if interner is None else interner(value)
+    subnode = yaml.nodes.ScalarNode(tag, node.value, node.start_mark, node.end_mark, node.style)
+    return loader.construct_object(subnode, True)
+
 def construct_from_scalar(cls, loader, node):
-    tag = loader.resolve(yaml.nodes.ScalarNode, node.value, (True, False))
-    subnode = yaml.nodes.ScalarNode(tag, node.value, node.start_mark, node.end_mark, node.style) 
-    value = loader.construct_object(subnode, True)
-    return cls(value)
+    return cls(_construct_scalar_value(loader, node))
 
 def construct_from_none(cls, loader, node):
     assert loader.construct_yaml_null(node) is None
     return cls()
 
-def construct_from_value(cls, loader, node):
-    if isinstance(node, yaml.nodes.ScalarNode):
-        tag = loader.resolve(yaml.nodes.ScalarNode, node.value, (True, False))
-        subnode = yaml.nodes.ScalarNode(tag, node.value, node.start_mark, node.end_mark, node.style) 
-        value = loader.construct_object(subnode, True)
-    elif isinstance(node, yaml.nodes.SequenceNode):
-        value = loader.construct_sequence(node, True)
-    elif isinstance(node, yaml.nodes.MappingNode):
-        value = loader.construct_mapping(node, True)
-    else:
+def _node_kind(table, node):
+    # Exact node types hit the table, subclasses are found by isinstance.
+    handler = table.get(type(node))
+    if handler is None:
+        for kind in (yaml.nodes.ScalarNode, yaml.nodes.SequenceNode, yaml.nodes.MappingNode):
+            if isinstance(node, kind):
+                return table[kind]
         raise ValueError(node)
-    return cls(value)
+    return handler
+
+_VALUES = {
+    yaml.nodes.ScalarNode: _construct_scalar_value,
+    yaml.nodes.SequenceNode: lambda loader, node: loader.construct_sequence(node, True),
+    yaml.nodes.MappingNode: lambda loader, node: loader.construct_mapping(node, True),
+}
+
+def construct_from_value(cls, loader, node):
+    return cls(_node_kind(_VALUES, node)(loader, node))
 
 def construct_from_args_kwargs(cls, loader, node):
     mapping = loader.construct_mapping(node, True)
-    args = mapping.pop("=", ())
-    return cls(*args, **mapping)
+    args = mapping.get("=", ())
+    kwargs = dict((key, value) for key, value in mapping.items() if key != "=")
+    return cls(*args, **kwargs)
+
+_ANY = {
+    yaml.nodes.ScalarNode: construct_from_scalar,
+    yaml.nodes.SequenceNode: construct_from_sequence,
+    yaml.nodes.MappingNode: construct_from_args_kwargs,
+}
 
 def construct_from_any(cls, loader, node):
-    if isinstance(node, yaml.nodes.ScalarNode):
-        return construct_from_scalar(cls, loader, node)
-    elif isinstance(node, yaml.nodes.SequenceNode):
-        return construct_from_sequence(cls, loader, node)
-    elif isinstance(node, yaml.nodes.MappingNode):
-        return construct_from_args_kwargs(cls, loader, node)
+    return _node_kind(_ANY, node)(cls, loader, node)
+
+_INT_TAG = "tag:yaml.org,2002:int"
+_FLOAT_TAG = "tag:yaml.org,2002:float"
+
+# Comma separated decimal integers, the only YAML integers int() reads
+# the same way (YAML 1.1 takes 010 for octal and has 0x, 0b and 1:30).
+_DECIMALS = re.compile(r"[-+]?(?:0|[1-9][0-9_]*)(?:,[-+]?(?:0|[1-9][0-9_]*))*")
+
+def _convert_scalars(nodes):
+    tags = set(node.tag for node in nodes)
+    if not tags <= set([_INT_TAG, _FLOAT_TAG]):
+        return None
+    values = [node.value for node in nodes]
+    if _INT_TAG in tags:
+        integers = values if len(tags) == 1 else [
+            node.value for node in nodes if node.tag == _INT_TAG]
+        if not _DECIMALS.fullmatch(",".join(integers)):
+            return None
+    try:
+        if _FLOAT_TAG in tags:
+            return array("d", map(float, values))
+        return array("q", map(int, values))
+    except (ValueError, OverflowError):
+        return None
+
+def _convert_values(loader, node):
+    values = loader.construct_sequence(node, True)
+    if all(type(value) is int for value in values):
+        typecode = "q"
+    elif all(type(value) in (int, float) for value in values):
+        typecode = "d"
     else:
-        raise ValueError(node)
+        raise yaml.constructor.ConstructorError(None, None,
+            "expected a sequence of numbers", node.start_mark)
+    try:
+        return array(typecode, values)
+    except OverflowError as exc:
+        raise yaml.constructor.ConstructorError(None, None,
+            "found unacceptable number (%s)" % exc, node.start_mark)
+
+def _construct_numbers(loader, node):
+    items = node.value
+    if all(type(item) is yaml.nodes.ScalarNode for item in items):
+        data = _convert_scalars(items)
+        if data is None:
+            data = _convert_values(loader, node)
+        return data
+    if all(isinstance(item, yaml.nodes.SequenceNode) for item in items):
+        return [_construct_numbers(loader, item) for item in items]
+    return _convert_values(loader, node)
+
+def construct_array(cls, loader, node):
+    """
+    Builds a flat sequence of numbers as an `array.array`, of typecode 'q'
+    when all of them are integers and 'd' otherwise, converting the scalar
+    values in one go instead of constructing each of them. Nested sequences
+    become lists of arrays. `cls` is called with the result unless it is
+    `array.array` itself, `numpy.array` for instance reads the arrays
+    through the buffer protocol.
+    """
+    if not isinstance(node, yaml.nodes.SequenceNode):
+        raise yaml.constructor.ConstructorError(None, None,
+            "expected a sequence node, but found %s" % node.id, node.start_mark)
+    data = _construct_numbers(loader, node)
+    if isinstance(cls, LazyObject):
+        cls = cls._target()
+    if cls is array:
+        return data
+    return cls(data)
+
+_STR_TAG = "tag:yaml.org,2002:str"
+
+def construct_record(cls, loader, node):
+    """
+    Builds a `Record` class made by `record_type` from a mapping node,
+    putting each value straight into the slot of its key instead of
+    building a mapping first. A sequence node fills the fields in order.
+    """
+    if isinstance(node, yaml.nodes.SequenceNode):
+        return cls(*loader.construct_sequence(node, True))
+    if not isinstance(node, yaml.nodes.MappingNode):
+        raise yaml.constructor.ConstructorError(None, None,
+            "expected a mapping node, but found %s" % node.id, node.start_mark)
+    loader.flatten_mapping(node)
+    values = list(cls._defaults)
+    index = cls._index
+    construct = loader.construct_object
+    for key_node, value_node in node.value:
+        # Plain field names are used as they are written.
+        if type(key_node) is yaml.nodes.ScalarNode and key_node.tag == _STR_TAG:
+            key = key_node.value
+        else:
+            key = construct(key_node, deep=True)
+        try:
+            position = index.get(key)
+        except TypeError:
+            position = None
+        if position is None:
+            raise yaml.constructor.ConstructorError("while constructing a record",
+                node.start_mark, "found unknown field %r" % (key,), key_node.start_mark)
+        values[position] = construct(value_node, deep=True)
+    try:
+        return cls._make(values)
+    except TypeError as exc:
+        raise yaml.constructor.ConstructorError(None, None, str(exc), node.start_mark)
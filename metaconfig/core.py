@@ -1,18 +1,34 @@
 from functools import reduce, partial
-from collections import OrderedDict
+from contextlib import contextmanager
+from collections.abc import Mapping, MutableMapping
+import copy
 from pathlib import Path
-from io import IOBase
+from io import IOBase, StringIO
+import hashlib
+import mmap
+import threading
+import time
+import gc
+import os
 
 import yaml
-from zope.dottedname.resolve import resolve
 
+from .resolver import default_resolver
+from .serialize import dump_nodes, load_nodes
+from .bundle import Bundle
+from .schema import compile_schema
+from .records import Record, record_type
+from .mappings import CompactMapping
 from .constructors import (
     construct_from_mapping,
-    construct_from_string
+    construct_from_string,
+    construct_record,
     )
 
 __all__ = [
     'Config',
+    'Loader',
+    'PythonLoader',
 ]
 
 if yaml.__with_libyaml__:
@@ -20,27 +36,55 @@ if yaml.__with_libyaml__:
 else:
     BaseLoader = yaml.Loader
 
-class Loader(BaseLoader):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+class LoaderMixin(object):
+    mapping_type = dict
 
-        self.add_constructor(u'tag:yaml.org,2002:map', type(self).construct_yaml_map)
-        self.add_constructor(u'tag:yaml.org,2002:omap', type(self).construct_yaml_map)
+    def __init__(self, stream, constructors=None, mapping=None, interner=None):
+        super().__init__(stream)
+        if constructors is not None:
+            self.yaml_constructors = constructors
+        if mapping is not None:
+            self.mapping_type = mapping
+        self._fill_mappings = (isinstance(self.mapping_type, type)
+            and issubclass(self.mapping_type, MutableMapping))
+        self._interner = interner
+        if interner is not None:
+            self.construct_object = self._construct_interned
+
+    def _construct_interned(self, node, deep=False):
+        # Aliases are served from `constructed_objects`, which is updated
+        # with the canonical value so they share it too.
+        if node in self.constructed_objects:
+            return self.constructed_objects[node]
+        data = super().construct_object(node, deep=deep)
+        data = self.constructed_objects[node] = self._interner(data)
+        return data
 
     def construct_yaml_map(self, node):
-        data = OrderedDict()
+        # Frozen mappings can not be filled in later, they are built in one
+        # go at the cost of not supporting recursive structures.
+        if not self._fill_mappings:
+            return self.construct_mapping(node)
+        return self._construct_yaml_map(node)
+
+    def _construct_yaml_map(self, node):
+        data = self.mapping_type()
         yield data
         value = self.construct_mapping(node)
         data.update(value)
 
-    def construct_mapping(self, node, deep=False):
+    def construct_mapping(self, node, deep=False, values=None):
+        """
+        Mapping of `node` in `mapping_type`. Values are constructed by
+        `values(loader, key_node, key, value_node)` when given.
+        """
         if isinstance(node, yaml.MappingNode):
             self.flatten_mapping(node)
         else:
             raise yaml.constructor.ConstructorError(None, None,
                 'expected a mapping node, but found %s' % node.id, node.start_mark)
 
-        mapping = OrderedDict()
+        pairs = []
         for key_node, value_node in node.value:
             key = self.construct_object(key_node, deep=deep)
             try:
@@ -48,41 +92,512 @@ class Loader(BaseLoader):
             except TypeError as exc:
                 raise yaml.constructor.ConstructorError('while constructing a mapping',
                     node.start_mark, 'found unacceptable key (%s)' % exc, key_node.start_mark)
-            value = self.construct_object(value_node, deep=deep)
-            mapping[key] = value
-        return mapping
-
-def _create_core(frame, names):
-    class TypesTable(object):
-        _frame = frame
-        def __init__(self, **types):
-            for name, declaration in types.items():
-                self.register(name, **declaration)
-
-        def register(self, _name, type, load):
-            loader = partial(load, type)
-            if _name.startswith("tag:"):
-                tag = _name
+            if values is None:
+                value = self.construct_object(value_node, deep=deep)
+            else:
+                value = values(self, key_node, key, value_node)
+            pairs.append((key, value))
+        return self.mapping_type(pairs)
+
+class Loader(LoaderMixin, BaseLoader):
+    pass
+
+class PythonLoader(LoaderMixin, yaml.Loader):
+    pass
+
+for _loader in (Loader, PythonLoader):
+    _loader.add_constructor(u'tag:yaml.org,2002:map', _loader.construct_yaml_map)
+    _loader.add_constructor(u'tag:yaml.org,2002:omap', _loader.construct_yaml_map)
+
+_MISSING = object()
+_CONTENDED = object()
+
+class ConstructorScope(dict):
+    """
+    Tag to constructor table of a single frame, used by its loaders in place
+    of the class-wide `yaml_constructors`.
+
+    Tags are looked up in the constructors declared by the frame, newest
+    first, then in its core constructors and in the table of the loader
+    class. Grabbing another scope links it as a layer instead of copying
+    its constructors, and resolved tags are memoized in the dict itself.
+    """
+    def __init__(self, base):
+        super().__init__()
+        self._base = base
+        self._core = {}
+        self._private = {}
+        self._layers = []
+        self._exports = {}
+        self._missing = set()
+
+    def __contains__(self, tag):
+        if dict.__contains__(self, tag):
+            return True
+        if tag in self._missing:
+            return False
+        constructor = self._lookup(tag)
+        if constructor is _MISSING:
+            self._missing.add(tag)
+            return False
+        self[tag] = constructor
+        return True
+
+    def __missing__(self, tag):
+        if self.__contains__(tag):
+            return dict.__getitem__(self, tag)
+        raise KeyError(tag)
+
+    def _invalidate(self):
+        self.clear()
+        self._missing.clear()
+        self._exports.clear()
+
+    def _export(self, tag):
+        constructor = self._exports.get(tag, None)
+        if constructor is None:
+            constructor = self._exports[tag] = self._find_export(tag, set())
+        return constructor
+
+    def _find_export(self, tag, visiting):
+        # Files including each other link their scopes both ways, a scope
+        # already being searched has nothing more to offer.
+        visiting.add(id(self))
+        for layer in reversed(self._layers):
+            if isinstance(layer, ConstructorScope):
+                if id(layer) in visiting:
+                    continue
+                constructor = layer._exports.get(tag, None)
+                if constructor is None:
+                    constructor = layer._find_export(tag, visiting)
             else:
-                tag = "!" + _name
-            self._frame.loader.add_constructor(tag, loader)
+                constructor = layer.get(tag, _MISSING)
+            if constructor is not _MISSING:
+                return constructor
+        return _MISSING
+
+    def _lookup(self, tag):
+        for table in (self._private, self._core):
+            constructor = table.get(tag, _MISSING)
+            if constructor is not _MISSING:
+                return constructor
+        constructor = self._export(tag)
+        if constructor is not _MISSING:
+            return constructor
+        return self._base.get(tag, _MISSING)
+
+    def set_core(self, tag, constructor):
+        self._core[tag] = constructor
+        self._invalidate()
+
+    def declare(self, tag, constructor):
+        # Redefinitions of core and built-in tags stay local to the frame,
+        # only the frame's own types are exported to the includer.
+        if tag in self._core or tag in self._base:
+            self._private[tag] = constructor
+        else:
+            if not self._layers or isinstance(self._layers[-1], ConstructorScope):
+                self._layers.append({})
+            self._layers[-1][tag] = constructor
+        self._invalidate()
+
+    def snapshot(self):
+        """
+        Scope resolving tags as this one does now, unaffected by later
+        declarations made in this frame.
+        """
+        scope = ConstructorScope(self._base)
+        scope._core = dict(self._core)
+        scope._private = dict(self._private)
+        scope._layers = list(self._layers)
+        if self._layers and not isinstance(self._layers[-1], ConstructorScope):
+            self._layers.append({})
+        return scope
+
+    def grab(self, scope):
+        for index, layer in enumerate(self._layers):
+            if layer is scope:
+                del self._layers[index]
+                break
+        self._layers.append(scope)
+        self._invalidate()
+
+    def inherit(self, scope):
+        for layer in scope._layers:
+            self.grab(layer)
+
+    def extend(self, scope):
+        # Copy on write, lookups running meanwhile keep the list they
+        # started with. Scopes grabbed again are found at their newest
+        # place first, so they are not looked for and removed.
+        self._layers = self._layers + scope._layers
+        self._invalidate()
+
+    @property
+    def empty(self):
+        return not (self._layers or self._private)
+
+@contextmanager
+def _paused_gc():
+    # Prefetched node graphs are large and acyclic, letting the collector
+    # traverse them over and over again only burns time.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+def _digest(source):
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+def _named_stream(source, filename):
+    stream = StringIO(source)
+    stream.name = filename
+    return stream
+
+def _compose(source, filename, loader):
+    return list(yaml.compose_all(_named_stream(source, filename), Loader=loader))
+
+class _MappedFile(object):
+    """
+    Read-only memory map of a file exposing the `read` and `name` the
+    parsers expect, so they pull bytes straight from the page cache in
+    chunks instead of going through a decoded copy of the whole file.
+    """
+    def __init__(self, path):
+        self.name = str(path)
+        with open(self.name, "rb") as stream:
+            try:
+                self._buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can not be mapped.
+                self._buffer = None
+        if self._buffer is not None and hasattr(self._buffer, "madvise"):
+            self._buffer.madvise(mmap.MADV_SEQUENTIAL)
+
+    def read(self, size=-1):
+        if self._buffer is None:
+            return b""
+        return self._buffer.read(size)
+
+    def digest(self):
+        return hashlib.sha256(self._buffer or b"").hexdigest()
+
+    def close(self):
+        if self._buffer is not None:
+            self._buffer.close()
+            self._buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _compose_dumped(source, filename, loader):
+    return dump_nodes(_compose(source, filename, loader))
+
+def _walk_nodes(nodes):
+    visited = set()
+    pending = list(reversed(nodes))
+    while pending:
+        node = pending.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        yield node
+        if isinstance(node, yaml.SequenceNode):
+            pending.extend(reversed(node.value))
+        elif isinstance(node, yaml.MappingNode):
+            for key_node, value_node in reversed(node.value):
+                pending.append(value_node)
+                pending.append(key_node)
+
+def _scan_scalars(nodes, tag):
+    for node in _walk_nodes(nodes):
+        if node.tag == tag and isinstance(node, yaml.ScalarNode):
+            yield node.value
+
+def _scan_keys(nodes, tag):
+    for node in _walk_nodes(nodes):
+        if node.tag == tag and isinstance(node, yaml.MappingNode):
+            for key_node, _ in node.value:
+                if isinstance(key_node, yaml.ScalarNode):
+                    yield key_node.value
 
-    frame.loader.add_constructor("!" + names["declare"], partial(construct_from_mapping, TypesTable))
-    frame.loader.add_constructor("!" + names["get"], partial(construct_from_string, frame.get))
-    frame.loader.add_constructor("!" + names["let"], partial(construct_from_mapping, frame.add))
-    frame.loader.add_constructor("!" + names["resolve"], partial(construct_from_string, frame.resolve))
+class TypesTable(object):
+    def __init__(self, _frame, **types):
+        self._frame = _frame
+        for name, declaration in types.items():
+            self.register(name, **declaration)
+
+    def register(self, _name, type=None, load=None, schema=None, fields=None):
+        if fields is not None:
+            if type is not None:
+                raise ValueError("{0} declares both a type and fields".format(_name))
+            type = record_type(_name, fields)
+            if load is None:
+                load = construct_record
+        if schema is None:
+            loader = partial(load, type)
+        else:
+            loader = compile_schema(schema).constructor(type)
+        if _name.startswith("tag:"):
+            tag = _name
+        else:
+            tag = "!" + _name
+        self._frame.constructors.declare(tag, self._frame.instrument(tag, loader))
+
+_EVALUATING = object()
+
+class _Claim(object):
+    """
+    Marks a file or a lazy binding as being constructed by a thread, which
+    calls `finish` once it is done with it. The event waited on is only
+    made when another thread has to wait.
+    """
+    __slots__ = ('owner', '_finished', '_done')
+
+    def __init__(self):
+        self.owner = threading.get_ident()
+        self._finished = False
+        self._done = None
+
+    def finish(self):
+        with _claims_lock:
+            self._finished = True
+            done = self._done
+        if done is not None:
+            done.set()
+
+# Claim each thread waits for, so that threads waiting on each other,
+# through files or lazy bindings, are told instead of blocking forever.
+_claims_lock = threading.Lock()
+_waiting = {}
+
+def _wait_for(claim):
+    # False when the owner of `claim` waits, directly or not, for the
+    # calling thread, which would never get it done.
+    thread = threading.get_ident()
+    with _claims_lock:
+        if claim._finished:
+            return True
+        owner = claim.owner
+        seen = set()
+        while owner is not None and owner not in seen:
+            if owner == thread:
+                return False
+            seen.add(owner)
+            waited = _waiting.get(owner)
+            owner = None if waited is None else waited.owner
+        if claim._done is None:
+            claim._done = threading.Event()
+        done = claim._done
+        _waiting[thread] = claim
+    try:
+        done.wait()
+    finally:
+        with _claims_lock:
+            _waiting.pop(thread, None)
+    return True
+
+class _Evaluator(object):
+    """
+    Loaders constructing the lazy bindings of one document, one per thread
+    as bindings may be evaluated by several at once. They share the nodes
+    constructed so far, keeping anchors shared between bindings.
+    """
+    __slots__ = ('_create', '_constructed', '_loaders')
+
+    def __init__(self, create):
+        self._create = create
+        self._constructed = {}
+        self._loaders = {}
+
+    def construct(self, node):
+        thread = threading.get_ident()
+        loader = self._loaders.get(thread)
+        if loader is None:
+            loader = self._loaders[thread] = self._create()
+            loader.constructed_objects = self._constructed
+        recursive = loader.recursive_objects
+        pending = set(recursive)
+        try:
+            return loader.construct_object(node, deep=True)
+        except BaseException:
+            # The nodes the failed construction was in are left marked as
+            # under construction, which would hide the error next time.
+            for node in [node for node in recursive if node not in pending]:
+                del recursive[node]
+            raise
+
+class Binding(object):
+    """
+    Value of a lazy `!let` binding, constructed from its node on first call.
+    No lock is held while it is constructed, other threads wait for the
+    claim of the constructing one.
+    """
+    __slots__ = ('_evaluator', '_node', '_value', '_claim')
+
+    def __init__(self, evaluator, node):
+        self._evaluator = evaluator
+        self._node = node
+        self._value = _MISSING
+        self._claim = None
+
+    def __call__(self):
+        value = self._value
+        if value is not _MISSING and value is not _EVALUATING:
+            return value
+        while True:
+            with _claims_lock:
+                value = self._value
+                if value is _MISSING:
+                    claim = self._claim = _Claim()
+                    self._value = _EVALUATING
+                    break
+                if value is not _EVALUATING:
+                    return value
+                claim = self._claim
+            if claim.owner == threading.get_ident() or not _wait_for(claim):
+                raise yaml.constructor.ConstructorError(None, None,
+                    "found recursive reference between lazy bindings", self._node.start_mark)
+        try:
+            value = self._evaluator.construct(self._node)
+        except BaseException:
+            with _claims_lock:
+                self._value = _MISSING
+                self._claim = None
+            claim.finish()
+            raise
+        with _claims_lock:
+            self._value = value
+            self._evaluator = self._node = self._claim = None
+        claim.finish()
+        return value
+
+class _FrozenBinding(object):
+    """
+    Lazy binding of a frozen frame, its value is frozen once evaluated.
+    """
+    __slots__ = ('_binding', '_freeze', '_value')
+
+    def __init__(self, binding, freeze):
+        self._binding = binding
+        self._freeze = freeze
+        self._value = _MISSING
+
+    def __call__(self):
+        value = self._value
+        if value is not _MISSING:
+            return value
+        with _claims_lock:
+            if self._value is not _MISSING:
+                return self._value
+            binding, freeze = self._binding, self._freeze
+        value = freeze(binding())
+        with _claims_lock:
+            if self._value is _MISSING:
+                self._value = value
+                self._binding = self._freeze = None
+            return self._value
+
+def _get_binding(bindings, name):
+    value = bindings[name]
+    if type(value) is Binding or type(value) is _FrozenBinding:
+        value = value()
+        bindings[name] = value
+    return value
+
+def construct_lazy_bindings(frame, get_tag, loader, node):
+    if not isinstance(node, yaml.MappingNode):
+        raise yaml.constructor.ConstructorError(None, None,
+            'expected a mapping node, but found %s' % node.id, node.start_mark)
+    loader.flatten_mapping(node)
+    # Bindings of one document share constructed nodes, keeping anchors
+    # shared, and resolve tags and `!get` as declared at this point of the
+    # file.
+    scope = frame.constructors.snapshot()
+    evaluator = _Evaluator(partial(frame.loader, "", constructors=scope))
+    bindings = {}
+    for key_node, value_node in node.value:
+        key = loader.construct_object(key_node, deep=True)
+        bindings[key] = Binding(evaluator, value_node)
+    visible = dict(frame.dependencies)
+    visible.update(bindings)
+    scope.set_core(get_tag, frame.instrument(get_tag,
+        partial(construct_from_string, partial(_get_binding, visible))))
+    frame.add(**bindings)
+
+_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+def _node_marks(name, node):
+    # Start marks of the nodes of a binding by their path. Explicit keys
+    # are walked before merged ones and win, aliased nodes only once.
+    marks = {}
+    seen = set()
+    pending = [((name,), node)]
+    while pending:
+        path, node = pending.pop()
+        marks.setdefault(path, node.start_mark)
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, yaml.MappingNode):
+            merged = []
+            keys = []
+            for key_node, value_node in node.value:
+                if key_node.tag == _MERGE_TAG:
+                    merged.append((path, value_node))
+                elif isinstance(key_node, yaml.ScalarNode):
+                    keys.append((path + (key_node.value,), value_node))
+            pending.extend(merged)
+            pending.extend(keys)
+        elif isinstance(node, yaml.SequenceNode):
+            pending.extend((path + (str(index),), item) for index, item in enumerate(node.value))
+    return marks
+
+def construct_marked_bindings(frame, construct, loader, node):
+    result = construct(loader, node)
+    for key_node, value_node in node.value:
+        if isinstance(key_node, yaml.ScalarNode):
+            frame.marks[key_node.value] = _node_marks(key_node.value, value_node)
+    return result
+
+def _create_core(frame, names, lazy=False, marks=False):
+    def register(name, constructor):
+        tag = "!" + names[name]
+        frame.constructors.set_core(tag, frame.instrument(tag, constructor))
+
+    register("declare", partial(construct_from_mapping, partial(TypesTable, frame)))
+    register("get", partial(construct_from_string, frame.get))
+    if lazy:
+        let = partial(construct_lazy_bindings, frame, "!" + names["get"])
+    else:
+        let = partial(construct_from_mapping, frame.add)
+    if marks:
+        let = partial(construct_marked_bindings, frame, let)
+    register("let", let)
+    register("resolve", partial(construct_from_string, frame.resolve))
 
 class ConfigStackFrame(object):
-    def __init__(self, filepath, root, names):
+    def __init__(self, filepath, root, names, lazy=False, resolver=None, lazy_resolve=False,
+                 metrics=None, loader=Loader, mapping=None, interner=None, marks=False):
         self._filepath = None if filepath is None else Path(filepath)
         self._root = Path(root)
         self._dependencies = {}
-        self._resolved = {}
+        self._marks = {}
+        self._found = {}
+        self._resolver = default_resolver if resolver is None else resolver
+        self._lazy_resolve = lazy_resolve
+        self._metrics = metrics
         self._data = None
-        self._empty_names = set()
-        class FrameLoader(Loader): pass
-        self._loader = FrameLoader
-        _create_core(self, names=names)
+        self._constructors = ConstructorScope(loader.yaml_constructors)
+        self._loader = partial(loader, constructors=self._constructors, mapping=mapping,
+            interner=interner)
+        _create_core(self, names=names, lazy=lazy, marks=marks)
 
     @property
     def filename(self):
@@ -92,22 +607,53 @@ class ConfigStackFrame(object):
     def dirpath(self):
         return self._root
 
-    def get(self, name): 
-        return self._dependencies[name]
+    def get(self, name):
+        return _get_binding(self._dependencies, name)
 
     def add(self, **deps): 
         self._dependencies.update(deps)
 
     def grab(self, frame):
-        for name, con in frame._loader.yaml_constructors.items():
-            if name in self._empty_names: continue
-            self._loader.add_constructor(name, con)
+        self._constructors.grab(frame._constructors)
+        self._dependencies.update(frame._dependencies)
+        self._marks.update(frame._marks)
+
+    def inherit(self, frame):
+        """
+        Takes over the bindings and grabbed scopes of `frame` without
+        linking to the frame itself.
+        """
+        self._constructors.inherit(frame._constructors)
         self._dependencies.update(frame._dependencies)
+        self._marks.update(frame._marks)
+
+    def merge(self, frame):
+        """
+        Adds the bindings and grabbed scopes of `frame` in place, each of
+        them in one step, for the published top level frame.
+        """
+        self._constructors.extend(frame._constructors)
+        self._dependencies.update(frame._dependencies)
+        self._marks.update(frame._marks)
+        self._found = {}
+
+    @property
+    def empty(self):
+        return not self._dependencies and self._constructors.empty
 
     def resolve(self, dotted):
-        if dotted not in self._resolved:
-            self._resolved[dotted] = resolve(dotted)
-        return self._resolved[dotted]
+        if self._lazy_resolve:
+            return self._resolver.lazy(dotted)
+        return self._resolver.resolve(dotted)
+
+    @property
+    def constructors(self):
+        return self._constructors
+
+    def instrument(self, tag, constructor):
+        if self._metrics is None:
+            return constructor
+        return self._metrics.wrap(tag, constructor)
 
     @property
     def loader(self):
@@ -117,10 +663,134 @@ class ConfigStackFrame(object):
     def data(self):
         return self._data
 
+    @property
+    def dependencies(self):
+        return self._dependencies
+
+    @property
+    def marks(self):
+        """
+        Start marks of the nodes of each binding, by binding name and then
+        by path, recorded by configs created with `marks=True`.
+        """
+        return self._marks
+
+    def lookup(self, path):
+        # Only the binding named by the path is evaluated and only its
+        # branch walked, found paths are remembered as they are written.
+        try:
+            return self._found[path]
+        except KeyError:
+            pass
+        # Paths walked before a merge are not remembered after it.
+        found = self._found
+        segments = _split_path(path)
+        value = self.get(segments[0])
+        for segment in segments[1:]:
+            value = _step(value, segment)
+        found[path] = value
+        return value
+
+    def evaluate(self):
+        """
+        Evaluates the lazy bindings of the frame, those failing raise again
+        when they are read.
+        """
+        for name in list(self._dependencies):
+            try:
+                self.get(name)
+            except Exception:
+                pass
+
+    def frozen(self, freeze):
+        """
+        Copy of the frame with its documents and bindings passed through
+        `freeze`. Lazy bindings not evaluated yet are frozen if they ever
+        are.
+        """
+        frame = copy.copy(self)
+        if self._data is not None:
+            frame._data = tuple(map(freeze, self._data))
+        frame._dependencies = dict((name, freeze(value))
+            for name, value in self._dependencies.items())
+        frame._found = {}
+        return frame
+
     def load(self, stream):
-        self._empty_names = set(self._loader.yaml_constructors)
         self._data = list(yaml.load_all(stream, Loader=self._loader))
 
+    def load_nodes(self, nodes):
+        loader = self._loader("")
+        try:
+            self._data = [loader.construct_document(node) for node in nodes]
+        finally:
+            loader.dispose()
+
+_ATOMS = frozenset((str, bytes, int, float, complex, bool, type(None)))
+
+class _Freezer(object):
+    """
+    Converts values to immutable equivalents: dicts to `CompactMapping`,
+    lists to tuples, sets to frozensets and records to records of frozen
+    values. Every object is converted once, so shared values stay shared.
+    """
+    def __init__(self, interner=None):
+        self._interner = interner
+        self._memo = {}
+
+    def clear(self):
+        self._memo.clear()
+
+    def __call__(self, value):
+        if type(value) in _ATOMS:
+            return value if self._interner is None else self._interner(value)
+        entry = self._memo.get(id(value))
+        if entry is not None:
+            return entry[1]
+        if isinstance(value, (dict, CompactMapping)):
+            frozen = CompactMapping((self(key), self(item)) for key, item in value.items())
+        elif type(value) is list or type(value) is tuple:
+            frozen = tuple(map(self, value))
+        elif type(value) is set or type(value) is frozenset:
+            frozen = frozenset(map(self, value))
+        elif isinstance(value, Record):
+            frozen = type(value)._make(map(self, value._values()))
+        elif type(value) is Binding:
+            # Bindings which failed to evaluate when the config was frozen.
+            if value._value is _MISSING or value._value is _EVALUATING:
+                frozen = _FrozenBinding(value, self)
+            else:
+                frozen = self(value._value)
+        else:
+            frozen = value
+        if self._interner is not None:
+            frozen = self._interner(frozen)
+        # The original is kept alive so that its id is not reused.
+        self._memo[id(value)] = (value, frozen)
+        return frozen
+
+def _step(value, segment):
+    # Child of `value` named by one path segment, `KeyError` if none.
+    if isinstance(value, Mapping):
+        if segment in value:
+            return value[segment]
+        for key in value:
+            if str(key) == segment:
+                return value[key]
+    elif type(value) is list or type(value) is tuple:
+        if segment.isdigit() and int(segment) < len(value):
+            return value[int(segment)]
+    elif isinstance(value, Record):
+        if segment in value._index:
+            return getattr(value, segment)
+    raise KeyError(segment)
+
+def _split_path(path):
+    if path.startswith("/"):
+        return tuple(segment.replace("~1", "/").replace("~0", "~")
+            for segment in path[1:].split("/"))
+    return tuple(path.split("."))
+
 DEFAULT_NAMES = {
     "declare": "declare",
     "get": "get",
@@ -130,7 +800,9 @@ DEFAULT_NAMES = {
 }
 
 class Config(object):
-    def __init__(self, names=None):
+    def __init__(self, names=None, cache=None, lazy=False, resolver=None, lazy_resolve=False,
+                 metrics=None, loader=Loader, mapping=None, interner=None, memory_map=False,
+                 frame_cache=None, marks=False):
         names_mix = dict(DEFAULT_NAMES)
         if names is not None:
             names_mix.update(names)
@@ -138,7 +810,112 @@ class Config(object):
         self._frames = {}
         self._names = names_mix
         self._results = {}
-        self._stack = [ConfigStackFrame(None, self.root, self._names)]
+        self._cache = cache
+        self._lazy = lazy
+        self._resolver = default_resolver if resolver is None else resolver
+        self._lazy_resolve = lazy_resolve
+        self._metrics = metrics
+        self._loader = loader
+        self._mapping = mapping
+        self._interner = interner
+        self._memory_map = memory_map
+        self._frame_cache = frame_cache
+        self._marks = marks
+        self._schemas = {}
+        self._frozen = False
+        # Everything besides the file itself deciding what its frame holds.
+        self._frame_profile = (tuple(sorted(names_mix.items())), loader, mapping, interner,
+            lazy, self._resolver, lazy_resolve, metrics, marks)
+        self._prefetched = {}
+        self._sources = {}
+        self._mapped = set()
+        self._dependants = {}
+        self._includes = {}
+        self._roots = []
+        self._lock = threading.RLock()
+        self._loading = {}
+        self._local = threading.local()
+        self._base = self._create_frame(None, self.root)
+
+    def _create_frame(self, filepath, root):
+        frame = ConfigStackFrame(filepath, root, self._names, lazy=self._lazy,
+            resolver=self._resolver, lazy_resolve=self._lazy_resolve, metrics=self._metrics,
+            loader=self._loader, mapping=self._mapping, interner=self._interner,
+            marks=self._marks)
+        for tag, constructor in self._schemas.items():
+            frame.constructors.set_core(tag, frame.instrument(tag, constructor))
+        return frame
+
+    def add_schema(self, name, spec, type=None):
+        """
+        Makes `!name` available to every file loaded afterwards, as if
+        declared with `schema: spec`. Returns the compiled `Schema`, which
+        is shared by every config using the same spec.
+        """
+        schema = compile_schema(spec)
+        tag = name if name.startswith("tag:") else "!" + name
+        with self._lock:
+            self._schemas[tag] = schema.constructor(type)
+            self._frame_profile += ((tag, schema, type),)
+        return schema
+
+    @property
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            return [self._base]
+        return stack
+
+    @contextmanager
+    def _session(self, replace=False):
+        """
+        Gives the calling thread its own frame stack on top of an empty
+        staging frame for the duration of the outermost load. Its scope is
+        then merged into the published top level scope at once, or replaces
+        it by swapping in a new frame, so readers never see a partial load.
+        """
+        if getattr(self._local, "stack", None) is not None:
+            yield
+            return
+        if self._frozen:
+            raise RuntimeError("Config is frozen")
+        staging = self._create_frame(None, self.root)
+        self._local.stack = [staging]
+        self._local.partial = {}
+        try:
+            yield
+        finally:
+            self._local.stack = self._local.partial = None
+        if replace:
+            with self._lock:
+                base = self._create_frame(None, self.root)
+                base.inherit(staging)
+                self._base = base
+        elif not staging.empty:
+            with self._lock:
+                self._base.merge(staging)
+
+    def _claim(self, path):
+        # Returns the frame of `path` once another thread loading it is
+        # done, `None` when the caller is the one to load it, or
+        # `_CONTENDED` when the loading thread waits, through the files or
+        # lazy bindings it needs, for the caller. The caller then loads its
+        # own copy.
+        while True:
+            with self._lock:
+                frame = self._frames.get(path)
+                if frame is not None:
+                    return frame
+                claim = self._loading.get(path)
+                if claim is None:
+                    self._loading[path] = _Claim()
+                    return None
+            if not _wait_for(claim):
+                return _CONTENDED
+
+    def _release(self, path):
+        with self._lock:
+            self._loading.pop(path).finish()
 
     def peek_frame(self):
         return self._stack[-1]
@@ -158,7 +935,14 @@ class Config(object):
     def get_frame(self, filename):
         if filename is None:
             return None
-        return self._frames.get(Path(filename))
+        path = Path(filename)
+        frame = self._frames.get(path)
+        if frame is None:
+            # Frames under construction are only visible to their thread.
+            partial = getattr(self._local, "partial", None)
+            if partial:
+                frame = partial.get(path)
+        return frame
 
     def get_path(self, relative):
         frame = self.peek_frame()
@@ -167,12 +951,36 @@ class Config(object):
     def open_file(self, path):
         return Path(path).open("rt", encoding="utf-8")
 
+    def map_file(self, path):
+        """
+        Binary stream over a memory map of `path`, used in place of
+        `open_file` by configs created with `memory_map=True`.
+        """
+        return _MappedFile(path)
+
+    def file_signature(self, path):
+        """
+        Cheap fingerprint of `path` compared by `changed_files` before
+        falling back to hashing the content, `None` when unavailable.
+        """
+        try:
+            stat = os.stat(str(path))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_source(self, path):
+        signature = self.file_signature(path)
+        with self._measure(str(path), "read"):
+            with self.open_file(path) as stream:
+                return signature, stream.read()
+
     def push_file(self, relative):
         path = None if relative is None else Path(relative)
         self._files.append(path)
         root = self.root if path is None else path.parent
-        frame = ConfigStackFrame(path, root, self._names)
-        self._frames[path] = frame
+        frame = self._create_frame(path, root)
+        self._local.partial[path] = frame
         self.push_frame(frame)
 
     def pop_file(self):
@@ -181,6 +989,56 @@ class Config(object):
     def get(self, name): 
         return self.peek_frame().get(name)
 
+    def lookup(self, path):
+        """
+        Value at `path` in the top level scope, given as dotted names
+        starting with a binding, `services.db.pool.size`, or as a JSON
+        pointer, `/services/db/pool/size`. Sequence items are addressed by
+        index and record fields by name. A path is walked on its first
+        lookup after a load, later lookups of it are a dict access.
+        """
+        stack = getattr(self._local, "stack", None)
+        frame = self._base if stack is None else stack[-1]
+        try:
+            return frame.lookup(path)
+        except KeyError:
+            raise KeyError(path)
+
+    def where(self, path):
+        """
+        Start mark of the node `path` was constructed from, or of its
+        closest ancestor with one, such as the `!get` it was taken by.
+        Needs a config created with `marks=True`.
+        """
+        if not self._marks:
+            raise ValueError("Config does not record marks, create it with marks=True")
+        segments = _split_path(path)
+        marks = self.peek_frame().marks.get(segments[0], {})
+        for end in range(len(segments), 0, -1):
+            mark = marks.get(segments[:end])
+            if mark is not None:
+                return mark
+        raise KeyError(path)
+
+    @property
+    def resolver(self):
+        return self._resolver
+
+    @property
+    def metrics(self):
+        return self._metrics
+
+    @contextmanager
+    def _measure(self, filename, phase):
+        if self._metrics is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._metrics.record(filename, phase, time.perf_counter() - start)
+
     @property
     def extra_files(self):
         return self._files
@@ -188,30 +1046,473 @@ class Config(object):
     def log(self, text):
         print(text)
 
-    def _load_config(self, stream, filename):
+    def _track(self, filename):
+        if len(self._stack) == 1:
+            self._roots.append(filename)
+            return
+        parent = self.peek_frame().filename
+        if parent is not None and filename is not None:
+            self._dependants.setdefault(Path(filename), set()).add(parent)
+            self._includes.setdefault(parent, {})[Path(filename)] = None
+
+    def _load_config(self, stream, filename, nodes=None):
+        self._track(filename)
         frame = self.get_frame(filename)
         if frame is not None:
             self.push_frame(frame)
-            self.pop_frame()            
+            self.pop_frame()
         else:
             self.push_file(filename)
             frame = self.peek_frame()
-            frame.loader.add_constructor("!" + self._names["load"], partial(construct_from_string, self.load))
+            self._register_load(frame)
             self.log("Loading config: {}".format(filename))
-            frame.load(stream)
+            if self._metrics is not None:
+                self._metrics.file_started(filename)
+            if nodes is None and self._cache is not None and filename is not None:
+                with self._measure(filename, "parse"):
+                    nodes = self._cache.compose(stream.read(), filename, self._loader)
+            elif nodes is None and self._metrics is not None:
+                with self._measure(filename, "parse"):
+                    nodes = list(yaml.compose_all(stream, Loader=self._loader))
+            if nodes is not None:
+                with self._measure(filename, "construct"):
+                    frame.load_nodes(nodes)
+            else:
+                frame.load(stream)
+            if self._metrics is not None:
+                self._metrics.file_finished(filename)
             self.pop_file()
+            self._frames[frame.filename] = frame
+            self._local.partial.pop(frame.filename, None)
         return frame.data
 
+    def _register_load(self, frame):
+        load_tag = "!" + self._names["load"]
+        frame.constructors.set_core(load_tag, frame.instrument(load_tag,
+            partial(construct_from_string, partial(self._load_relative, frame))))
+
+    def _load_relative(self, frame, relative):
+        # Lazy bindings are evaluated once their file is off the stack,
+        # their `!load`s still resolve against its directory.
+        if self.peek_frame() is not frame:
+            relative = frame.dirpath.joinpath(relative)
+        return self.load(relative)
+
     def load(self, filename_or_stream):
+        """
+        Loads a file or stream, merging its scope into the top level one.
+        Safe to call from several threads at once, a file requested by
+        many of them is only loaded by the first.
+        """
+        with self._session():
+            return self._load(filename_or_stream)
+
+    def _load(self, filename_or_stream):
         filename = None
         if isinstance(filename_or_stream, (str, Path)):
             path = self.get_path(filename_or_stream)
             filename = str(path)
-            with self.open_file(path) as stream:
-                return self._load_config(stream, filename)
+            if self.get_frame(filename) is not None:
+                return self._load_config(None, filename)
+            claimed = self._claim(path)
+            if claimed is not None and claimed is not _CONTENDED:
+                return self._load_config(None, filename)
+            try:
+                self._mapped.discard(path)
+                if path in self._prefetched:
+                    signature, digest, nodes = self._prefetched.pop(path)
+                    return self._load_file(path, signature, digest, None, nodes)
+                if self._memory_map and self._cache is None:
+                    return self._load_mapped(path)
+                signature, source = self._read_source(path)
+                return self._load_file(path, signature, _digest(source),
+                    _named_stream(source, filename))
+            finally:
+                if claimed is None:
+                    self._release(path)
         elif isinstance(filename_or_stream, IOBase):
             if hasattr(filename_or_stream, "name"):
                 filename = filename_or_stream.name
             return self._load_config(filename_or_stream, filename)
         else:
             raise ValueError("Invalid parameter {0}".format(filename_or_stream))
+
+    def _load_mapped(self, path):
+        # Digests of mapped files are taken over the raw bytes and may
+        # differ from the text digest of the same file.
+        signature = self.file_signature(path)
+        with self._measure(str(path), "read"):
+            stream = self.map_file(path)
+        with stream:
+            self._mapped.add(path)
+            return self._load_file(path, signature, stream.digest(), stream)
+
+    def _load_file(self, path, signature, digest, stream, nodes=None):
+        self._sources[path] = (signature, digest)
+        if self._frame_cache is None:
+            return self._load_config(stream, str(path), nodes)
+        key = (str(path), digest, self._frame_profile)
+        if self._adopt_frame(path, key):
+            return self._load_config(None, str(path))
+        data = self._load_config(stream, str(path), nodes)
+        frame = self.get_frame(path)
+        if self._shareable(frame):
+            self._frame_cache.put(key, frame, self._collect_includes(path))
+        return data
+
+    def _shareable(self, frame):
+        # A lazy binding not evaluated yet would load its includes into
+        # this config, whichever config evaluates it.
+        nodes = [value._node for value in frame.dependencies.values()
+            if type(value) is Binding and value._node is not None]
+        return next(_scan_scalars(nodes, "!" + self._names["load"]), None) is None
+
+    def _collect_includes(self, path):
+        # Depth first in include order, which is the order the files were
+        # first loaded in.
+        includes = []
+        seen = set([path])
+        pending = [(path, child) for child in reversed(list(self._includes.get(path, ())))]
+        while pending:
+            parent, child = pending.pop()
+            if child in seen:
+                continue
+            seen.add(child)
+            signature, digest = self._sources[child]
+            includes.append((child, parent, signature, digest))
+            pending.extend((child, include)
+                for include in reversed(list(self._includes.get(child, ()))))
+        return tuple(includes)
+
+    def _include_is_current(self, path, signature, digest):
+        known = self._sources.get(path)
+        if known is not None:
+            return known[1] == digest
+        if signature is not None and self.file_signature(path) == signature:
+            return True
+        try:
+            return self._file_digest(path) == digest
+        except OSError:
+            return False
+
+    def _adopt_frame(self, path, key):
+        """
+        Takes the frame of `path` from the shared frame cache when every
+        file it includes is unchanged, registering them as if they were
+        loaded by this config.
+        """
+        entry = self._frame_cache.get(key)
+        if entry is None:
+            return False
+        frame, includes = entry
+        for child, parent, signature, digest in includes:
+            if not self._include_is_current(child, signature, digest):
+                return False
+        self._files.append(path)
+        for child, parent, signature, digest in includes:
+            self._sources.setdefault(child, (signature, digest))
+            self._dependants.setdefault(child, set()).add(parent)
+            self._includes.setdefault(parent, {})[child] = None
+            if child not in self._frames:
+                shared = self._frame_cache.peek((str(child), digest, self._frame_profile))
+                if shared is not None:
+                    self._frames[child] = shared[0]
+                    self._files.append(child)
+        self._frames[path] = frame
+        return True
+
+    def _file_digest(self, path):
+        if path in self._mapped:
+            with self.map_file(path) as stream:
+                return stream.digest()
+        _, source = self._read_source(path)
+        return _digest(source)
+
+    def iter_documents(self, filename_or_stream):
+        """
+        Yields the documents of a file one at a time as they are constructed,
+        without keeping them around, while `!declare` and `!let` still take
+        effect in order. The file's scope is merged into the current one once
+        the iteration completes, the file is not cached as a frame.
+        """
+        if isinstance(filename_or_stream, (str, Path)):
+            path = self.get_path(filename_or_stream)
+            stream = self.open_file(path)
+            owned = True
+        elif isinstance(filename_or_stream, IOBase):
+            stream = filename_or_stream
+            path = getattr(stream, "name", None)
+            path = None if path is None else Path(path)
+            owned = False
+        else:
+            raise ValueError("Invalid parameter {0}".format(filename_or_stream))
+        frame = self._create_frame(path, self.root if path is None else path.parent)
+        self._register_load(frame)
+        self.log("Streaming config: {}".format(path))
+        try:
+            loader = frame.loader(stream)
+            try:
+                while True:
+                    # The frame is only on the stack while a document is
+                    # constructed, suspending the generator leaves it clean.
+                    with self._session():
+                        self.push_frame(frame)
+                        try:
+                            if not loader.check_data():
+                                break
+                            document = loader.get_data()
+                        finally:
+                            self._stack.pop()
+                    yield document
+            finally:
+                loader.dispose()
+        finally:
+            if owned:
+                stream.close()
+        with self._session():
+            self.peek_frame().grab(frame)
+
+    def _get_include_path(self, relative, parent):
+        # `get_path` resolves against the top frame, a frame of `parent` is
+        # pushed for it on the calling thread's own stack.
+        stack = getattr(self._local, "stack", None)
+        temporary = stack is None
+        if temporary:
+            stack = self._local.stack = [self._base]
+        stack.append(self._create_frame(parent, parent.parent))
+        try:
+            return self.get_path(relative)
+        finally:
+            stack.pop()
+            if temporary:
+                self._local.stack = None
+
+    def prefetch(self, filename, executor):
+        """
+        Reads `filename` and every file reachable through `!load` and
+        composes them on `executor`, siblings concurrently. A following
+        `load` constructs the prefetched documents in declaration order.
+        Process pools ship the node graphs back in the compact `serialize`
+        encoding, thread pools hand them over as they are.
+        """
+        from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+        tag = "!" + self._names["load"]
+        dumped = isinstance(executor, ProcessPoolExecutor)
+        compose = _compose_dumped if dumped else _compose
+        seen = set()
+        leaves = set()
+        sources = {}
+        running = {}
+
+        def submit(path):
+            if path in seen or self.get_frame(path) is not None:
+                return
+            seen.add(path)
+            signature, source = self._read_source(path)
+            sources[path] = (signature, _digest(source))
+            if tag not in source:
+                leaves.add(path)
+            if self._cache is not None:
+                key, nodes = self._cache.fetch(source, str(path), self._loader)
+                if nodes is not None:
+                    complete(path, nodes)
+                    return
+            else:
+                key = None
+            future = executor.submit(compose, source, str(path), self._loader)
+            running[future] = (path, key)
+
+        def complete(path, nodes):
+            self._prefetched[path] = sources.pop(path) + (nodes,)
+            if path in leaves:
+                return
+            for relative in _scan_scalars(nodes, tag):
+                submit(self._get_include_path(relative, path))
+
+        submit(self.get_path(filename))
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, key = running.pop(future)
+                nodes = future.result()
+                if dumped:
+                    nodes = load_nodes(nodes, str(path))
+                if key is not None:
+                    self._cache.put(key, nodes)
+                complete(path, nodes)
+
+    def load_parallel(self, filename, executor=None):
+        from concurrent.futures import ProcessPoolExecutor
+        with _paused_gc():
+            if executor is None:
+                with ProcessPoolExecutor() as executor:
+                    self.prefetch(filename, executor)
+            else:
+                self.prefetch(filename, executor)
+            return self.load(filename)
+
+    def compile(self, filename):
+        """
+        Composes `filename` and every file reachable through `!load` into a
+        `Bundle` for `load_compiled`, recording the names the tree resolves
+        and declares. Nothing is constructed.
+        """
+        names = self._names
+        load_tag = "!" + names["load"]
+        root = self.get_path(filename)
+        bundle = Bundle(root.name)
+        resolves = set()
+        declares = set()
+        seen = set()
+        pending = [root]
+        while pending:
+            path = pending.pop()
+            if path in seen:
+                continue
+            seen.add(path)
+            signature, source = self._read_source(path)
+            nodes = _compose(source, str(path), self._loader)
+            bundle.add(Path(os.path.relpath(str(path), str(root.parent))).as_posix(),
+                signature, _digest(source), nodes)
+            if load_tag in source:
+                pending.extend(reversed([self._get_include_path(relative, path)
+                    for relative in _scan_scalars(nodes, load_tag)]))
+            resolves.update(_scan_scalars(nodes, "!" + names["resolve"]))
+            declares.update(_scan_keys(nodes, "!" + names["declare"]))
+        bundle.resolves = sorted(resolves)
+        bundle.declares = sorted(declares)
+        return bundle
+
+    def load_compiled(self, bundle, root=None):
+        """
+        Loads a bundle written by `compile`, given as a path, bytes or a
+        `Bundle`. Files are placed relative to `root`, the directory of the
+        bundle file by default. A file whose source is present and differs
+        from the compiled one is loaded from source instead.
+        """
+        if isinstance(bundle, (str, Path)):
+            path = self.get_path(bundle)
+            with self._measure(str(path), "read"):
+                bundle = Bundle.loads(path.read_bytes())
+            if root is None:
+                root = path.parent
+        elif not isinstance(bundle, Bundle):
+            bundle = Bundle.loads(bundle)
+        base = self.get_path(self.root if root is None else root)
+        with _paused_gc():
+            for relative, signature, digest, dumped in bundle.files:
+                path = base.joinpath(relative).resolve()
+                if self.get_frame(path) is not None:
+                    continue
+                current = self.file_signature(path)
+                if current is not None and current != signature:
+                    _, source = self._read_source(path)
+                    if _digest(source) != digest:
+                        self.log("Compiled config is stale: {}".format(path))
+                        continue
+                    signature = current
+                self._prefetched[path] = (signature, digest, Bundle.nodes(dumped, str(path)))
+            return self.load(base.joinpath(bundle.root))
+
+    def changed_files(self):
+        """
+        Paths of the loaded files whose content differs from what was
+        loaded. Files with an unchanged `file_signature` are not read.
+        """
+        changed = []
+        for path, (signature, digest) in list(self._sources.items()):
+            current = self.file_signature(path)
+            if current is not None and current == signature:
+                continue
+            try:
+                current_digest = self._file_digest(path)
+            except OSError:
+                changed.append(path)
+                continue
+            if current_digest != digest:
+                changed.append(path)
+            else:
+                self._sources[path] = (current, digest)
+        return changed
+
+    @property
+    def frozen(self):
+        return self._frozen
+
+    def freeze(self, gc_freeze=False):
+        """
+        Replaces the loaded documents and bindings by immutable copies, see
+        `_Freezer`, interned by the config's interner if any, so forked
+        workers can share them without copying. Frames shared with other
+        configs through a frame cache are left as they are. Loading into
+        a frozen config raises a RuntimeError.
+
+        Lazy bindings are evaluated first, including the files they load.
+        Those failing are left to raise when read, and are frozen if they
+        are ever evaluated.
+
+        With `gc_freeze` a collection is run and every object then alive is
+        moved to the permanent generation (`gc.freeze`), so that collections
+        in forked workers do not write to the pages of the config either.
+        Without it the frozen copies are new objects which the first
+        collection in a worker writes to, and a worker may copy more than
+        from a config left as is, see benchmarks/bench_freeze.py.
+        """
+        with self._lock:
+            if not self._frozen:
+                self._evaluate_bindings()
+                freeze = _Freezer(self._interner)
+                self._frames = dict((path, frame.frozen(freeze))
+                    for path, frame in self._frames.items())
+                self._base = self._base.frozen(freeze)
+                # Lazy bindings evaluated later share values through the
+                # memo, which would keep every original alive otherwise.
+                freeze.clear()
+                self._frozen = True
+        if gc_freeze:
+            gc.collect()
+            gc.freeze()
+        return self
+
+    def _evaluate_bindings(self):
+        # Bindings loading files add frames and top level bindings, which
+        # may be lazy in turn.
+        while True:
+            count = (len(self._frames), len(self._base.dependencies))
+            for frame in list(self._frames.values()) + [self._base]:
+                frame.evaluate()
+            if count == (len(self._frames), len(self._base.dependencies)):
+                return
+
+    def reload(self):
+        """
+        Reconstructs the changed files and every file including them,
+        reusing the frames of the rest, and rebuilds the top level scope
+        by replaying the top level loads. Returns the changed paths.
+        """
+        if self._frozen:
+            raise RuntimeError("Config is frozen")
+        changed = self.changed_files()
+        if not changed:
+            return changed
+        if None in self._roots:
+            raise ValueError("Config loaded from an anonymous stream can not be reloaded")
+        stale = set(changed)
+        pending = list(changed)
+        while pending:
+            for parent in self._dependants.get(pending.pop(), ()):
+                if parent not in stale:
+                    stale.add(parent)
+                    pending.append(parent)
+        for path in stale:
+            self._frames.pop(path, None)
+            self._sources.pop(path, None)
+            self._includes.pop(path, None)
+        for parents in self._dependants.values():
+            parents.difference_update(stale)
+        self._files = [path for path in self._files if path not in stale]
+        roots, self._roots = self._roots, []
+        with self._session(replace=True):
+            for root in roots:
+                self.load(root)
+        return changed
@@ -0,0 +1,61 @@
+from operator import is_
+
+from .mappings import CompactMapping
+
+__all__ = [
+    'Interner',
+]
+
+class Interner(object):
+    """
+    Table of canonical immutable values. Calling it with a value returns
+    the first equal value it was called with: strings, bytes, integers and
+    finite non-zero floats by value, tuples and `CompactMapping`s when
+    their already canonical items are the same objects, so identical
+    subtrees are stored once. Mutable values are returned as they are.
+
+    Canonical values live as long as the interner, share one between the
+    configs of a process or `clear` it to release them.
+    """
+    def __init__(self):
+        # One table per type, so that 1, 1.0 and True stay apart without
+        # allocating a key for every scalar.
+        self._scalars = dict((kind, {}) for kind in (str, bytes, int, bool, float))
+        self._containers = {}
+
+    def __call__(self, value):
+        kind = type(value)
+        table = self._scalars.get(kind)
+        if table is not None:
+            # 0.0 == -0.0 and nan != nan, neither can be keyed by value.
+            if kind is float and (not value or value != value):
+                return value
+            return table.setdefault(value, value)
+        if kind is tuple:
+            items = value
+        elif kind is CompactMapping:
+            items = value._values
+        else:
+            return value
+        try:
+            canonical = self._containers.setdefault(value, value)
+        except TypeError:
+            return value
+        if canonical is value:
+            return value
+        # Equality is not enough, (1,) == (1.0,) and mappings compare
+        # equal regardless of key order.
+        if kind is tuple:
+            shared = all(map(is_, canonical, items))
+        else:
+            shared = (canonical._shape is value._shape
+                and all(map(is_, canonical._values, items)))
+        return canonical if shared else value
+
+    def __len__(self):
+        return len(self._containers) + sum(map(len, self._scalars.values()))
+
+    def clear(self):
+        for table in self._scalars.values():
+            table.clear()
+        self._containers.clear()
@@ -0,0 +1,62 @@
+from collections.abc import Mapping
+import weakref
+
+__all__ = [
+    'CompactMapping',
+]
+
+class _Shape(object):
+    __slots__ = ('keys', 'index', '__weakref__')
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.index = dict((key, position) for position, key in enumerate(keys))
+
+_shapes = weakref.WeakValueDictionary()
+
+def _get_shape(keys):
+    shape = _shapes.get(keys)
+    if shape is None:
+        shape = _shapes.setdefault(keys, _Shape(keys))
+    return shape
+
+class CompactMapping(Mapping):
+    """
+    Frozen, ordered mapping storing its values in a tuple. The key order and
+    key index are shared between every mapping with the same keys, so
+    thousands of records of the same shape cost little more than tuples.
+    """
+    __slots__ = ('_shape', '_values')
+
+    def __init__(self, items=()):
+        data = dict(items)
+        self._shape = _get_shape(tuple(data))
+        self._values = tuple(data.values())
+
+    def __getitem__(self, key):
+        return self._values[self._shape.index[key]]
+
+    def __contains__(self, key):
+        return key in self._shape.index
+
+    def __iter__(self):
+        return iter(self._shape.keys)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __eq__(self, other):
+        if isinstance(other, CompactMapping):
+            if self._shape is other._shape:
+                return self._values == other._values
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self):
+        # Equality ignores the order of the keys, so must the hash.
+        return hash(frozenset(zip(self._shape.keys, self._values)))
+
+    def __reduce__(self):
+        return (type(self), (tuple(zip(self._shape.keys, self._values)),))
+
+    def __repr__(self):
+        return "{0}({1!r})".format(type(self).__name__, dict(zip(self._shape.keys, self._values)))
@@ -0,0 +1,112 @@
+import sys
+import threading
+import time
+
+__all__ = [
+    'LoadMetrics',
+]
+
+class LoadMetrics(object):
+    """
+    Collects load timings of a `Config`: read, parse and construction time
+    of every file, arranged in the include tree, and call counts and
+    cumulative durations of the constructors registered by `!declare` and
+    the core tags. Subclass it to forward measurements elsewhere.
+
+    Construction time of a file includes the files it `!load`s, `self` is
+    what remains after subtracting them.
+    """
+    PHASES = ("read", "parse", "construct")
+
+    def __init__(self):
+        self._files = {}
+        self._roots = []
+        self._local = threading.local()
+        self._tags = {}
+
+    @property
+    def _stack(self):
+        # Files being loaded by the calling thread.
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _entry(self, filename):
+        filename = "<stream>" if filename is None else str(filename)
+        entry = self._files.get(filename)
+        if entry is None or entry["done"]:
+            entry = {"file": filename, "done": False, "includes": []}
+            entry.update((phase, 0.0) for phase in self.PHASES)
+            self._files[filename] = entry
+        return entry
+
+    def record(self, filename, phase, seconds):
+        self._entry(filename)[phase] += seconds
+
+    def file_started(self, filename):
+        entry = self._entry(filename)
+        if self._stack:
+            self._stack[-1]["includes"].append(entry)
+        else:
+            self._roots.append(entry)
+        self._stack.append(entry)
+
+    def file_finished(self, filename):
+        self._stack.pop()["done"] = True
+
+    def wrap(self, tag, constructor):
+        stats = self._tags.setdefault(tag, [0, 0.0])
+        def measured(loader, node):
+            start = time.perf_counter()
+            try:
+                return constructor(loader, node)
+            finally:
+                stats[0] += 1
+                stats[1] += time.perf_counter() - start
+        return measured
+
+    @staticmethod
+    def _total(entry):
+        return entry["read"] + entry["parse"] + entry["construct"]
+
+    def _export(self, entry):
+        includes = [self._export(child) for child in entry["includes"]]
+        result = dict((phase, entry[phase]) for phase in self.PHASES)
+        result["file"] = entry["file"]
+        result["self"] = entry["construct"] - sum(
+            self._total(child) for child in entry["includes"])
+        result["total"] = self._total(entry)
+        result["includes"] = includes
+        return result
+
+    def as_dict(self):
+        return {
+            "files": [self._export(entry) for entry in self._roots],
+            "tags": dict(
+                (tag, {"count": count, "seconds": seconds})
+                for tag, (count, seconds) in self._tags.items()),
+        }
+
+    def to_json(self, **kwargs):
+        import json
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def print_tree(self, file=None):
+        file = sys.stdout if file is None else file
+
+        def show(entry, depth):
+            print("{0:9.3f}ms {1}{2}  (read {3:.3f}ms, parse {4:.3f}ms, self {5:.3f}ms)".format(
+                entry["total"] * 1000, "  " * depth, entry["file"],
+                entry["read"] * 1000, entry["parse"] * 1000, entry["self"] * 1000),
+                file=file)
+            for child in entry["includes"]:
+                show(child, depth + 1)
+
+        data = self.as_dict()
+        for entry in data["files"]:
+            show(entry, 0)
+        tags = sorted(data["tags"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+        for tag, stats in tags:
+            print("{0:9.3f}ms {1:8d}x {2}".format(
+                stats["seconds"] * 1000, stats["count"], tag), file=file)
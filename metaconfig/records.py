@@ -0,0 +1,113 @@
+from collections.abc import Mapping
+
+__all__ = [
+    'Record',
+    'record_type',
+]
+
+_MISSING = object()
+
+class Record(object):
+    """
+    Base of the plain data classes generated by `record_type`. Fields are
+    `__slots__`, so a record costs about as much as a tuple of its values
+    and reads its attributes without a dict lookup.
+    """
+    __slots__ = ()
+    _fields = ()
+    _defaults = ()
+    _index = {}
+    _setters = ()
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(self._fields):
+            raise TypeError("{0} takes {1} fields, {2} given".format(
+                type(self).__name__, len(self._fields), len(args)))
+        values = list(args) + list(self._defaults[len(args):])
+        for name, value in kwargs.items():
+            position = self._index.get(name)
+            if position is None:
+                raise TypeError("{0} has no field {1!r}".format(type(self).__name__, name))
+            if position < len(args):
+                raise TypeError("{0} got field {1!r} twice".format(type(self).__name__, name))
+            values[position] = value
+        self._fill(values)
+
+    @classmethod
+    def _make(cls, values):
+        record = object.__new__(cls)
+        record._fill(values)
+        return record
+
+    def _fill(self, values):
+        for name, setter, value in zip(self._fields, self._setters, values):
+            if value is _MISSING:
+                raise TypeError("{0} is missing field {1!r}".format(type(self).__name__, name))
+            setter(self, value)
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def _asdict(self):
+        return dict(zip(self._fields, self._values()))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "{0}({1})".format(type(self).__name__, ", ".join(
+            "{0}={1!r}".format(name, value) for name, value in zip(self._fields, self._values())))
+
+def _parse_fields(fields):
+    names = []
+    defaults = []
+    for field in fields:
+        if isinstance(field, Mapping):
+            for name, default in field.items():
+                names.append(name)
+                defaults.append(default)
+        else:
+            names.append(field)
+            defaults.append(_MISSING)
+    return names, defaults
+
+def _freeze(value):
+    if isinstance(value, Mapping):
+        return (Mapping, frozenset((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(map(_freeze, value)))
+    return (type(value), value)
+
+_types = {}
+
+def record_type(name, fields):
+    """
+    `Record` subclass with one slot per field. `fields` are names or one
+    item mappings of a name to its default, which is shared by the records
+    like a function default. The same name and fields give the same class,
+    so records of reloaded files compare equal.
+    """
+    names, defaults = _parse_fields(fields)
+    if len(set(names)) != len(names):
+        raise ValueError("duplicate field in {0!r}".format(fields))
+    try:
+        key = (name, tuple(names), _freeze(defaults))
+        cls = _types.get(key)
+    except TypeError:
+        key = cls = None
+    if cls is not None:
+        return cls
+    cls = type(str(name), (Record,), {
+        "__slots__": tuple(names),
+        "_fields": tuple(names),
+        "_defaults": tuple(defaults),
+        "_index": dict((field, position) for position, field in enumerate(names)),
+    })
+    cls._setters = tuple(getattr(cls, field).__set__ for field in names)
+    if key is not None:
+        cls = _types.setdefault(key, cls)
+    return cls
@@ -0,0 +1,81 @@
+import sys
+import threading
+import time
+
+__all__ = [
+    'Resolver',
+    'LazyObject',
+    'default_resolver',
+]
+
+class Resolver(object):
+    """
+    Resolves dotted names for `!resolve`, caching the results and the time
+    each first resolution took, which includes importing its modules.
+    """
+    def __init__(self):
+        self._resolved = {}
+        self._timings = {}
+        self._lock = threading.RLock()
+
+    def resolve(self, dotted):
+        try:
+            return self._resolved[dotted]
+        except KeyError:
+            pass
+        with self._lock:
+            if dotted in self._resolved:
+                return self._resolved[dotted]
+            from zope.dottedname.resolve import resolve
+            start = time.perf_counter()
+            value = resolve(dotted)
+            self._timings[dotted] = time.perf_counter() - start
+            self._resolved[dotted] = value
+            return value
+
+    def lazy(self, dotted):
+        try:
+            return self._resolved[dotted]
+        except KeyError:
+            return LazyObject(self, dotted)
+
+    def clear(self):
+        with self._lock:
+            self._resolved.clear()
+            self._timings.clear()
+
+    def report(self):
+        """
+        `(dotted name, seconds)` pairs of every resolution, slowest first.
+        """
+        return sorted(self._timings.items(), key=lambda item: item[1], reverse=True)
+
+    def print_report(self, file=None):
+        file = sys.stdout if file is None else file
+        for dotted, seconds in self.report():
+            print("{0:10.3f}ms  {1}".format(seconds * 1000, dotted), file=file)
+
+class LazyObject(object):
+    """
+    Proxy returned by lazy `!resolve`, resolving its target on first call
+    or attribute access.
+    """
+    __slots__ = ('_resolver', '_dotted')
+
+    def __init__(self, resolver, dotted):
+        self._resolver = resolver
+        self._dotted = dotted
+
+    def _target(self):
+        return self._resolver.resolve(self._dotted)
+
+    def __call__(self, *args, **kwargs):
+        return self._target()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._target(), name)
+
+    def __repr__(self):
+        return "<LazyObject {0}>".format(self._dotted)
+
+default_resolver = Resolver()
@@ -0,0 +1,270 @@
+from collections.abc import Mapping
+
+from types import GeneratorType
+
+import yaml
+
+from .constructors import _node_kind, _VALUES
+
+__all__ = [
+    'Schema',
+    'SchemaError',
+    'compile_schema',
+]
+
+class SchemaError(yaml.constructor.ConstructorError):
+    pass
+
+_MAP_TAG = "tag:yaml.org,2002:map"
+_SEQ_TAG = "tag:yaml.org,2002:seq"
+
+_TYPES = {
+    "str": (str,),
+    "int": (int,),
+    "float": (float, int),
+    "bool": (bool,),
+    "null": (type(None),),
+    "list": (list, tuple),
+    "map": (Mapping,),
+}
+
+def _fail(path, problem, mark):
+    if path:
+        problem = "{0}: {1}".format(path, problem)
+    raise SchemaError(None, None, problem, mark)
+
+def _construct(loader, node):
+    # Plain scalars have nothing to recurse into, their constructor is
+    # called directly instead of through `construct_object`.
+    if type(node) is yaml.ScalarNode and node.tag in loader.yaml_constructors:
+        value = loader.yaml_constructors[node.tag](loader, node)
+        if type(value) is not GeneratorType:
+            interner = loader._interner
+            return value if interner is None else interner(value)
+    return loader.construct_object(node, deep=True)
+
+def _untagged(loader, node):
+    return _node_kind(_VALUES, node)(loader, node)
+
+# Compiled specs `construct` nodes as they are tagged, while `build` is
+# used for the tagged node of the schema itself and constructs it as if
+# it was not tagged.
+
+class _Any(object):
+    __slots__ = ()
+
+    def construct(self, loader, node):
+        return _construct(loader, node)
+
+    def build(self, loader, node):
+        return _untagged(loader, node)
+
+    def check(self, value, mark):
+        pass
+
+class _Leaf(object):
+    __slots__ = ('_path', '_types', '_name', '_bools')
+
+    def __init__(self, path, types, name):
+        self._path = path
+        self._types = types
+        self._name = name
+        # bool is an int, but `true` is not a valid port number.
+        self._bools = any(issubclass(bool, kind) for kind in types
+            if kind is not int and kind is not float)
+
+    def construct(self, loader, node):
+        value = _construct(loader, node)
+        self.check(value, node.start_mark)
+        return value
+
+    def build(self, loader, node):
+        value = _untagged(loader, node)
+        self.check(value, node.start_mark)
+        return value
+
+    def check(self, value, mark):
+        if isinstance(value, self._types) and (self._bools or type(value) is not bool):
+            return
+        _fail(self._path, "expected {0}, but found {1}".format(
+            self._name, type(value).__name__), mark)
+
+class _Items(object):
+    __slots__ = ('_path', '_item')
+
+    def __init__(self, path, item):
+        self._path = path
+        self._item = item
+
+    def construct(self, loader, node):
+        if not isinstance(node, yaml.SequenceNode) or node.tag != _SEQ_TAG:
+            value = loader.construct_object(node, deep=True)
+            self.check(value, node.start_mark)
+            return value
+        return self.build(loader, node)
+
+    def build(self, loader, node):
+        if not isinstance(node, yaml.SequenceNode):
+            _fail(self._path, "expected a sequence, but found {0}".format(node.id),
+                node.start_mark)
+        construct = self._item.construct
+        value = loader.constructed_objects[node] = [
+            construct(loader, child) for child in node.value]
+        return value
+
+    def check(self, value, mark):
+        if not isinstance(value, (list, tuple)):
+            _fail(self._path, "expected a sequence, but found {0}".format(
+                type(value).__name__), mark)
+        for item in value:
+            self._item.check(item, mark)
+
+class _Fields(object):
+    __slots__ = ('_path', '_fields', '_required', '_extra')
+
+    def __init__(self, path, fields, required, extra):
+        self._path = path
+        self._fields = fields
+        self._required = required
+        self._extra = extra
+
+    def _value(self, loader, key_node, key, value_node):
+        field = self._fields.get(key, self._extra)
+        if field is None:
+            _fail(self._path, "unexpected key {0!r}".format(key), key_node.start_mark)
+        return field.construct(loader, value_node)
+
+    def construct(self, loader, node):
+        if not isinstance(node, yaml.MappingNode) or node.tag != _MAP_TAG:
+            value = loader.construct_object(node, deep=True)
+            self.check(value, node.start_mark)
+            return value
+        return self.build(loader, node)
+
+    def build(self, loader, node):
+        if not isinstance(node, yaml.MappingNode):
+            _fail(self._path, "expected a mapping, but found {0}".format(node.id),
+                node.start_mark)
+        value = loader.constructed_objects[node] = loader.construct_mapping(
+            node, True, values=self._value)
+        self._check_required(value, node.start_mark)
+        return value
+
+    def _check_required(self, value, mark):
+        for key in self._required:
+            if key not in value:
+                _fail(self._path, "missing key {0!r}".format(key), mark)
+
+    def check(self, value, mark):
+        if not isinstance(value, Mapping):
+            _fail(self._path, "expected a mapping, but found {0}".format(
+                type(value).__name__), mark)
+        for key, item in value.items():
+            field = self._fields.get(key, self._extra)
+            if field is None:
+                _fail(self._path, "unexpected key {0!r}".format(key), mark)
+            field.check(item, mark)
+        self._check_required(value, mark)
+
+def _join(path, key):
+    return "{0}.{1}".format(path, key) if path else str(key)
+
+def _compile(spec, path):
+    if isinstance(spec, Mapping):
+        fields = {}
+        required = []
+        extra = None
+        for key, value in spec.items():
+            if key == "*":
+                extra = _compile(value, _join(path, "*"))
+                continue
+            if isinstance(key, str) and key.endswith("?"):
+                key = key[:-1]
+            else:
+                required.append(key)
+            fields[key] = _compile(value, _join(path, key))
+        return _Fields(path, fields, tuple(required), extra)
+    if isinstance(spec, (list, tuple)):
+        if len(spec) != 1:
+            raise ValueError("sequence schema needs exactly one item schema: {0!r}".format(spec))
+        return _Items(path, _compile(spec[0], path + "[]"))
+    if isinstance(spec, type):
+        return _Leaf(path, (spec,), spec.__name__)
+    if isinstance(spec, str):
+        if spec == "any":
+            return _Any()
+        types = ()
+        for name in spec.split("|"):
+            if name.strip() not in _TYPES:
+                raise ValueError("unknown schema type {0!r}".format(name))
+            types += _TYPES[name.strip()]
+        return _Leaf(path, types, spec)
+    raise ValueError("invalid schema {0!r}".format(spec))
+
+class Schema(object):
+    """
+    Spec compiled into a constructor validating a node while building it,
+    so a tree is walked once. A spec is a type name (`str`, `int`, `float`,
+    `bool`, `null`, `list`, `map` or `any`, alternatives joined by `|`) or
+    a Python type, a one item list for sequences of that item, or a mapping
+    of keys to specs. Keys ending in `?` are optional and `*` gives the
+    spec of keys not listed, which are rejected otherwise.
+
+    Mapping and sequence specs build plain `!!map` and `!!seq` nodes
+    themselves, other nodes are constructed first and their values checked.
+    """
+    def __init__(self, spec):
+        self._spec = spec
+        self._root = _compile(spec, "")
+
+    @property
+    def spec(self):
+        return self._spec
+
+    def construct(self, loader, node):
+        return self._root.build(loader, node)
+
+    def validate(self, value):
+        """
+        Checks an already constructed value, errors carry no marks.
+        """
+        self._root.check(value, None)
+        return value
+
+    def constructor(self, type=None):
+        """
+        Tag constructor for `!declare` and `Config.add_schema`, passing the
+        validated value to `type` as `construct_from_any` does.
+        """
+        if type is None:
+            return self.construct
+        def construct(loader, node):
+            value = self._root.build(loader, node)
+            if isinstance(value, Mapping):
+                return type(**value)
+            if isinstance(value, (list, tuple)):
+                return type(*value)
+            return type(value)
+        return construct
+
+def _freeze(spec):
+    if isinstance(spec, Mapping):
+        return ("map", frozenset((key, _freeze(value)) for key, value in spec.items()))
+    if isinstance(spec, (list, tuple)):
+        return ("seq", tuple(_freeze(value) for value in spec))
+    return spec
+
+_schemas = {}
+
+def compile_schema(spec):
+    """
+    `Schema` of `spec`, compiled once per distinct spec for the process.
+    """
+    try:
+        key = _freeze(spec)
+        schema = _schemas.get(key)
+    except TypeError:
+        return Schema(spec)
+    if schema is None:
+        schema = _schemas.setdefault(key, Schema(spec))
+    return schema
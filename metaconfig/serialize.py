@@ -0,0 +1,91 @@
+"""
+Compact marshal-based encoding of composed YAML node graphs.
+
+Nodes are flattened into a table of records referencing their children by
+index, so anchors and aliases keep pointing to the same node after a round
+trip. Only the line and column of start marks are kept, end marks collapse
+onto them and snippets are not preserved.
+"""
+import marshal
+
+import yaml
+
+__all__ = [
+    'dump_nodes',
+    'load_nodes',
+]
+
+_SCALAR, _SEQUENCE, _MAPPING = range(3)
+
+_KINDS = {
+    yaml.ScalarNode: _SCALAR,
+    yaml.SequenceNode: _SEQUENCE,
+    yaml.MappingNode: _MAPPING,
+}
+
+def _encode(nodes):
+    tags = {}
+    index = {}
+    records = []
+
+    def visit(root):
+        pending = [root]
+        while pending:
+            node = pending.pop()
+            if id(node) in index:
+                continue
+            index[id(node)] = len(records)
+            records.append(node)
+            if isinstance(node, yaml.SequenceNode):
+                pending.extend(node.value)
+            elif isinstance(node, yaml.MappingNode):
+                for key_node, value_node in node.value:
+                    pending.append(key_node)
+                    pending.append(value_node)
+
+    for node in nodes:
+        visit(node)
+
+    table = []
+    for node in records:
+        kind = _KINDS[type(node)]
+        if kind == _SCALAR:
+            value = node.value
+            style = node.style
+        elif kind == _SEQUENCE:
+            value = tuple(index[id(item)] for item in node.value)
+            style = node.flow_style
+        else:
+            value = tuple(index[id(item)] for pair in node.value for item in pair)
+            style = node.flow_style
+        tag = tags.setdefault(node.tag, len(tags))
+        mark = node.start_mark
+        table.append((kind, tag, value, style, mark.line, mark.column))
+    return (tuple(tags), tuple(table), tuple(index[id(node)] for node in nodes))
+
+def _decode(data, name):
+    tags, table, roots = data
+    nodes = []
+    for kind, tag, value, style, line, column in table:
+        mark = yaml.Mark(name, 0, line, column, None, None)
+        if kind == _SCALAR:
+            node = yaml.ScalarNode(tags[tag], value, mark, mark, style)
+        elif kind == _SEQUENCE:
+            node = yaml.SequenceNode(tags[tag], value, mark, mark, style)
+        else:
+            node = yaml.MappingNode(tags[tag], value, mark, mark, style)
+        nodes.append(node)
+    for node in nodes:
+        if type(node) is yaml.SequenceNode:
+            node.value = [nodes[item] for item in node.value]
+        elif type(node) is yaml.MappingNode:
+            items = node.value
+            node.value = [(nodes[items[i]], nodes[items[i + 1]])
+                for i in range(0, len(items), 2)]
+    return [nodes[root] for root in roots]
+
+def dump_nodes(nodes):
+    return marshal.dumps(_encode(nodes))
+
+def load_nodes(data, name):
+    return _decode(marshal.loads(data), name)
@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+
+from test_multifile import MockedFSConfig, DocFileSystemMixin
+
+from metaconfig import AsyncConfig
+
+class MockedFSAsyncConfig(AsyncConfig, MockedFSConfig):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = []
+
+    async def read_file(self, path):
+        self.reads.append(str(path))
+        return await super().read_file(path)
+
+class TestAsyncLoad(DocFileSystemMixin, unittest.TestCase):
+    """
+    dependency1.yaml: |
+        --- !declare
+        tuple:
+            type: !resolve builtins.tuple
+            load: !resolve metaconfig.construct_from_value
+        ...
+        --- !let
+        value: !tuple [1, 2]
+        ...
+    dependency2.yaml: |
+        --- !load dependency1.yaml
+        --- !let
+        value1: !tuple [3]
+        other1: !get value
+        shadowed: 2
+        ...
+    dependency3.yaml: |
+        --- !load dependency1.yaml
+        --- !let
+        value2: !tuple [4]
+        other2: !get value
+        shadowed: 3
+        ...
+    multifile.yaml: |
+        --- !load dependency2.yaml
+        --- !load dependency3.yaml
+    """
+    def create(self):
+        config = MockedFSAsyncConfig(self.fs)
+        config.log = lambda text: None
+        return config
+
+    def test_aload(self):
+        config = self.create()
+        asyncio.run(config.aload("multifile.yaml"))
+        self.assertEqual(sorted(config.reads), [
+            "/dependency1.yaml",
+            "/dependency2.yaml",
+            "/dependency3.yaml",
+            "/multifile.yaml",
+            ])
+        self.assertEqual(config.get("value1"), (3,))
+        self.assertEqual(config.get("value2"), (4,))
+        self.assertIs(config.get("other1"), config.get("other2"))
+        self.assertEqual(config.get("shadowed"), 3)
+
+    def test_same_as_sync(self):
+        expected = self.create()
+        expected.load("multifile.yaml")
+        config = self.create()
+        asyncio.run(config.aload("multifile.yaml"))
+        for name in ("value", "value1", "value2", "other1", "other2", "shadowed"):
+            self.assertEqual(config.get(name), expected.get(name))
+        self.assertEqual(config.extra_files, expected.extra_files)
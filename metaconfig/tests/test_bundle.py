@@ -0,0 +1,81 @@
+import shutil
+import unittest
+
+from metaconfig import Config, Bundle
+from metaconfig.__main__ import main
+from utils import TemporaryFiles
+
+class TestBundle(TemporaryFiles, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.write("src/types.yaml", """
+            --- !declare
+            func:
+                type: !resolve metaconfig.tests.utils.identity
+                load: !resolve metaconfig.construct_from_sequence
+            ...
+            """)
+        self.write("src/parts/leaf.yaml", """
+            --- !load ../types.yaml
+            --- !let
+            leaf: !func [1, 2]
+            ...
+            """)
+        self.write("src/main.yaml", """
+            --- !load parts/leaf.yaml
+            --- !let
+            main: !get leaf
+            ...
+            """)
+
+    def config(self):
+        config = Config()
+        config.log = lambda text: None
+        return config
+
+    def compile(self):
+        output = self.root.joinpath("main.mcb")
+        main(["compile", str(self.root.joinpath("src/main.yaml")), "-o", str(output)])
+        return output
+
+    def test_manifest(self):
+        bundle = Bundle.loads(self.compile().read_bytes())
+        self.assertEqual(bundle.root, "main.yaml")
+        self.assertEqual([entry[0] for entry in bundle.files],
+            ["main.yaml", "parts/leaf.yaml", "types.yaml"])
+        self.assertEqual(bundle.resolves,
+            ["metaconfig.construct_from_sequence", "metaconfig.tests.utils.identity"])
+        self.assertEqual(bundle.declares, ["func"])
+
+    def test_load_without_sources(self):
+        output = self.compile()
+        shutil.rmtree(str(self.root.joinpath("src")))
+        config = self.config()
+        config.load_compiled(output, root=self.root)
+        self.assertEqual(config.get("main"), ((1, 2), {}))
+
+    def test_stale_source(self):
+        output = self.compile()
+        self.write("src/parts/leaf.yaml", """
+            --- !load ../types.yaml
+            --- !let
+            leaf: !func [3]
+            ...
+            """)
+        config = self.config()
+        config.load_compiled(output, root=self.root.joinpath("src"))
+        self.assertEqual(config.get("main"), ((3,), {}))
+
+    def test_touched_source(self):
+        output = self.compile()
+        self.touch("src/main.yaml")
+        config = self.config()
+        config.load_compiled(output.read_bytes(), root=self.root.joinpath("src"))
+        self.assertEqual(config.get("main"), ((1, 2), {}))
+        self.assertEqual(config.changed_files(), [])
+
+    def test_corrupted(self):
+        data = bytearray(self.compile().read_bytes())
+        data[-1] ^= 1
+        self.assertRaises(ValueError, Bundle.loads, bytes(data))
+        self.assertRaises(ValueError, Bundle.loads, b"not a bundle")
@@ -0,0 +1,69 @@
+import unittest
+
+from metaconfig import Config, NodeCache
+from metaconfig.core import Loader
+from utils import TemporaryFiles
+
+class TestNodeCache(TemporaryFiles, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.cache = NodeCache(self.root.joinpath("cache"))
+        self.write("dependency.yaml", """
+            --- !declare
+            tuple:
+                type: !resolve builtins.tuple
+                load: !resolve metaconfig.construct_from_value
+            ...
+            --- !let
+            value: !tuple [1, 2]
+            ...
+            """)
+        self.write("main.yaml", """
+            --- !load dependency.yaml
+            --- !let
+            other: !tuple [3, 4]
+            same: !get value
+            ...
+            """)
+
+    def load(self):
+        config = Config(cache=self.cache)
+        config.log = lambda text: None
+        config.load(str(self.root.joinpath("main.yaml")))
+        return config
+
+    def test_cold_and_warm(self):
+        cold = self.load()
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(self.cache.hits, 0)
+        warm = self.load()
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(self.cache.hits, 2)
+        for name in ("value", "other", "same"):
+            self.assertEqual(cold.get(name), warm.get(name))
+
+    def test_invalidation(self):
+        self.load()
+        self.write("dependency.yaml", """
+            --- !declare
+            tuple:
+                type: !resolve builtins.tuple
+                load: !resolve metaconfig.construct_from_value
+            ...
+            --- !let
+            value: !tuple [5, 6]
+            ...
+            """)
+        config = self.load()
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 3)
+        self.assertEqual(config.get("same"), (5, 6))
+
+    def test_corrupted_entry(self):
+        source = self.root.joinpath("main.yaml").read_text(encoding="utf-8")
+        path = self.cache.get_path(self.cache.key(source, Loader))
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"garbage")
+        config = self.load()
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(config.get("other"), (3, 4))
@@ -1,8 +1,9 @@
 from nose.tools import *
+import yaml
 from io import StringIO
 from textwrap import dedent
 
-from metaconfig import Config
+from metaconfig import Config, Resolver
 
 def test_construct_from_mapping():
 
@@ -293,3 +294,132 @@ def test_construct_from_any():
     value7 = config.get("value7")
     assert_tuple_equal(value7[0], (None,))
     assert_dict_equal(value7[1], {})
+
+def test_construct_from_scalar_implicit_tags():
+
+    source = """
+    --- !declare
+    func:
+        type: !resolve metaconfig.tests.utils.identity
+        load: !resolve metaconfig.constructors.construct_from_scalar
+    ...
+
+    --- !let
+    value1: !func true
+    value2: !func 0x10
+    value3: !func 2001-12-14
+    value4: !func 0x10
+    value5: !func ~
+    ...
+    """
+
+    config = Config()
+
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+
+    assert_tuple_equal(config.get("value1")[0], (True,))
+    assert_tuple_equal(config.get("value2")[0], (16,))
+    assert_equal(str(config.get("value3")[0][0]), "2001-12-14")
+    assert_tuple_equal(config.get("value4")[0], (16,))
+    assert_tuple_equal(config.get("value5")[0], (None,))
+
+def test_construct_from_any_node_subclass():
+    from metaconfig.constructors import construct_from_any
+
+    class Node(yaml.nodes.SequenceNode):
+        pass
+
+    loader = yaml.SafeLoader("")
+    node = Node("tag:yaml.org,2002:seq", [
+        yaml.nodes.ScalarNode("tag:yaml.org,2002:int", "1"),
+        yaml.nodes.ScalarNode("tag:yaml.org,2002:int", "2"),
+    ])
+    assert_tuple_equal(construct_from_any(lambda *items: items, loader, node), (1, 2))
+    assert_raises(ValueError, construct_from_any, list, loader, object())
+
+def test_construct_array():
+
+    source = """
+    --- !declare
+    array:
+        type: !resolve array.array
+        load: !resolve metaconfig.construct_array
+    tuple:
+        type: !resolve builtins.tuple
+        load: !resolve metaconfig.construct_array
+    ...
+
+    --- !let
+    ints: !array [1, -2, +3, 1_000]
+    floats: !array [0.5, 1, -2.5e+3]
+    octal: !array [010, 0x10, 2]
+    special: !array [.inf, 1.5]
+    nested: !tuple [[1, 2], [0.5, 1.5]]
+    empty: !array []
+    ...
+    """
+
+    config = Config()
+
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+
+    ints = config.get("ints")
+    assert_equal(ints.typecode, "q")
+    assert_list_equal(ints.tolist(), [1, -2, 3, 1000])
+
+    floats = config.get("floats")
+    assert_equal(floats.typecode, "d")
+    assert_list_equal(floats.tolist(), [0.5, 1.0, -2500.0])
+
+    assert_list_equal(config.get("octal").tolist(), [8, 16, 2])
+    assert_list_equal(config.get("special").tolist(), [float("inf"), 1.5])
+
+    first, second = config.get("nested")
+    assert_equal((first.typecode, first.tolist()), ("q", [1, 2]))
+    assert_equal((second.typecode, second.tolist()), ("d", [0.5, 1.5]))
+
+    assert_equal(len(config.get("empty")), 0)
+
+def test_construct_array_lazy():
+
+    source = """
+    --- !declare
+    array:
+        type: !resolve array.array
+        load: !resolve metaconfig.construct_array
+    ...
+
+    --- !let
+    ints: !array [1, 2]
+    ...
+    """
+
+    config = Config(resolver=Resolver(), lazy_resolve=True)
+
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+
+    ints = config.get("ints")
+    assert_equal(ints.typecode, "q")
+    assert_list_equal(ints.tolist(), [1, 2])
+
+def test_construct_array_errors():
+
+    source = """
+    --- !declare
+    array:
+        type: !resolve array.array
+        load: !resolve metaconfig.construct_array
+    ...
+
+    --- !let
+    value: !array {0}
+    ...
+    """
+
+    for value in ("[1, two]", "[100000000000000000000, 1]", "{a: 1}"):
+        config = Config()
+        with StringIO(dedent(source).format(value)) as stream:
+            assert_raises(yaml.constructor.ConstructorError, config.load, stream)
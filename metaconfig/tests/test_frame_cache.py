@@ -0,0 +1,119 @@
+import unittest
+
+from metaconfig import Config, FrameCache
+from utils import TemporaryFiles
+
+class TestFrameCache(TemporaryFiles, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.write("common/types.yaml", """
+            --- !declare
+            func:
+                type: !resolve metaconfig.tests.utils.identity
+                load: !resolve metaconfig.construct_from_sequence
+            ...
+            """)
+        self.write("common/base.yaml", """
+            --- !load types.yaml
+            --- !let
+            base: !func [1, 2]
+            ...
+            """)
+        for tenant in ("first", "second"):
+            self.write(tenant + ".yaml", """
+                --- !load common/base.yaml
+                --- !let
+                tenant: !func [{0}]
+                base: !get base
+                ...
+                """.format(tenant))
+
+    def path(self, name):
+        return self.root.joinpath(name).resolve()
+
+    def create(self, tenant, cache, **kwargs):
+        config = Config(frame_cache=cache, **kwargs)
+        config.loaded = []
+        config.log = config.loaded.append
+        config.load(str(self.root.joinpath(tenant + ".yaml")))
+        return config
+
+    def test_shared(self):
+        cache = FrameCache()
+        first = self.create("first", cache)
+        second = self.create("second", cache)
+
+        self.assertEqual(len(second.loaded), 1)
+        self.assertEqual(second.get("tenant"), (("second",), {}))
+        self.assertIs(second.get("base"), first.get("base"))
+        self.assertIs(second.get_frame(self.path("common/types.yaml")),
+            first.get_frame(self.path("common/types.yaml")))
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["entries"], 4)
+        self.assertEqual(second.changed_files(), [])
+
+        self.write("common/base.yaml", """
+            --- !load types.yaml
+            --- !let
+            base: !func [3]
+            ...
+            """)
+        self.assertEqual(second.reload(), [self.path("common/base.yaml")])
+        self.assertEqual(second.get("base"), ((3,), {}))
+        self.assertEqual(first.get("base"), ((1, 2), {}))
+
+    def test_extra_files(self):
+        cache = FrameCache()
+        first = self.create("first", cache)
+        again = self.create("first", cache)
+        self.assertEqual(len(again.loaded), 0)
+        self.assertEqual(first.extra_files, [self.path("first.yaml"),
+            self.path("common/base.yaml"), self.path("common/types.yaml")])
+        self.assertEqual(again.extra_files, first.extra_files)
+
+    def test_lazy_loads(self):
+        self.write("lazy.yaml", """
+            --- !let
+            lazy: !load first.yaml
+            ...
+            """)
+        cache = FrameCache()
+        first = self.create("lazy", cache, lazy=True)
+        second = self.create("lazy", cache, lazy=True)
+        self.assertEqual(len(second.loaded), 1)
+
+        second.get("lazy")
+        self.assertEqual(second.get("tenant"), (("first",), {}))
+        self.assertRaises(KeyError, first.get, "tenant")
+        self.assertIn(self.path("first.yaml"), second.extra_files)
+
+        # Lazy frames loading nothing are still shared.
+        self.assertEqual(len(self.create("first", cache, lazy=True).loaded), 0)
+
+    def test_changed_include(self):
+        cache = FrameCache()
+        self.create("first", cache)
+        self.write("common/base.yaml", """
+            --- !load types.yaml
+            --- !let
+            base: !func [3]
+            ...
+            """)
+        second = self.create("second", cache)
+        self.assertEqual(len(second.loaded), 2)
+        self.assertEqual(second.get("base"), ((3,), {}))
+
+    def test_options(self):
+        cache = FrameCache()
+        self.create("first", cache)
+        second = self.create("second", cache, lazy=True)
+        self.assertEqual(len(second.loaded), 3)
+
+    def test_eviction(self):
+        cache = FrameCache(max_bytes=2, sizeof=lambda frame: 1)
+        self.create("first", cache)
+        stats = cache.stats()
+        self.assertEqual((stats["entries"], stats["bytes"], stats["evictions"]), (2, 2, 1))
+        second = self.create("second", cache)
+        self.assertEqual(second.get("base"), ((1, 2), {}))
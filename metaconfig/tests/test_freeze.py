@@ -0,0 +1,92 @@
+from nose.tools import *
+from io import StringIO
+from textwrap import dedent
+from pathlib import Path
+import tempfile
+
+from metaconfig import Config, CompactMapping, FrameCache, Interner
+
+source = """
+--- !declare
+point:
+    fields: [x, {tags: []}]
+...
+--- !let
+first: &shared {host: localhost, ports: [80, 443], flags: !!set {a: ~}}
+second: *shared
+origin: !point {x: 0, tags: [a]}
+...
+--- {documents: [1, 2]}
+"""
+
+def load(**kwargs):
+    config = Config(**kwargs)
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+    return config
+
+def test_freeze():
+    config = load()
+    first = config.get("first")
+    assert_is(config.freeze(), config)
+    assert_true(config.frozen)
+
+    frozen = config.get("first")
+    assert_is_instance(frozen, CompactMapping)
+    assert_equal(frozen, {"host": "localhost", "ports": (80, 443), "flags": frozenset("a")})
+    assert_is(config.get("second"), frozen)
+    assert_equal(hash(frozen), hash(config.get("second")))
+    assert_equal(config.get("origin").tags, ("a",))
+    assert_list_equal(first["ports"], [80, 443])
+
+    with StringIO("--- !let\nthird: 3\n...\n") as stream:
+        assert_raises(RuntimeError, config.load, stream)
+    assert_raises(RuntimeError, config.reload)
+
+def test_lazy_and_interned():
+    config = load(lazy=True, interner=Interner())
+    config.freeze()
+
+    assert_equal(config.get("first")["ports"], (80, 443))
+    assert_is(config.get("first"), config.get("second"))
+
+def test_lazy_unused():
+    config = Config(lazy=True)
+    with StringIO(source + "--- !let\nbroken: !get missing\n...\n") as stream:
+        config.load(stream)
+    assert_equal(config.get("origin").tags, ["a"])
+    config.freeze()
+
+    assert_equal(config.get("origin").tags, ("a",))
+    assert_is_instance(config.get("first"), CompactMapping)
+    assert_is(config.get("first"), config.get("second"))
+    assert_raises(KeyError, config.get, "broken")
+
+def test_lazy_loads():
+    with tempfile.TemporaryDirectory() as temp:
+        root = Path(temp)
+        root.joinpath("a.yaml").write_text("--- !let\nx: !load b.yaml\n...\n")
+        root.joinpath("b.yaml").write_text("--- !let\ny: [1, 2]\n...\n")
+        config = Config(lazy=True)
+        config.load(str(root.joinpath("a.yaml")))
+        config.freeze()
+
+        assert_equal(config.get("y"), (1, 2))
+        assert_is_instance(config.get("x"), tuple)
+        assert_in(root.joinpath("b.yaml").resolve(), config.extra_files)
+
+def test_shared_frames():
+    with tempfile.TemporaryDirectory() as temp:
+        path = Path(temp).joinpath("config.yaml")
+        path.write_text(dedent(source))
+        cache = FrameCache()
+        first = Config(frame_cache=cache)
+        first.load(str(path))
+        first.freeze()
+        second = Config(frame_cache=cache)
+        second.load(str(path))
+
+        assert_is_instance(first.get("first"), CompactMapping)
+        assert_is_instance(second.get("first"), dict)
+        assert_equal(first.get_frame(str(path)).data[2], CompactMapping({"documents": (1, 2)}))
+        assert_equal(second.get_frame(str(path)).data[2], {"documents": [1, 2]})
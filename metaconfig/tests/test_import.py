@@ -0,0 +1,48 @@
+from nose.tools import *
+import subprocess
+import sys
+import types
+
+import metaconfig
+
+def run(code, *options):
+    return subprocess.run([sys.executable] + list(options) + ["-c", code],
+        check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+def imported_after(statement):
+    code = "import sys\n{0}\nprint(' '.join(sys.modules))".format(statement)
+    return set(run(code).stdout.split())
+
+def test_exports():
+    for module, names in metaconfig._EXPORTS.items():
+        submodule = getattr(metaconfig, module)
+        assert_is_instance(submodule, types.ModuleType)
+        assert_equal(submodule.__all__, names)
+        for name in names:
+            assert_is(getattr(metaconfig, name), getattr(submodule, name))
+    assert_raises(AttributeError, getattr, metaconfig, "missing")
+
+def test_package_import_is_lazy():
+    modules = imported_after("import metaconfig")
+    heavy = {"yaml", "asyncio", "concurrent.futures", "multiprocessing", "zope",
+        "json", "tempfile", "metaconfig.core"}
+    assert_equal(modules & heavy, set())
+
+def test_config_import_is_lazy():
+    modules = imported_after("from metaconfig import Config")
+    assert_in("yaml", modules)
+    heavy = {"asyncio", "concurrent.futures", "multiprocessing", "zope.dottedname.resolve",
+        "json", "tempfile", "metaconfig.aio", "metaconfig.cache"}
+    assert_equal(modules & heavy, set())
+
+def test_import_time():
+    # Bounds the package's own cumulative import time as reported by
+    # -X importtime, generously enough for slow machines.
+    stderr = run("import metaconfig", "-X", "importtime").stderr
+    for line in stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "metaconfig":
+            assert_less(int(fields[1]), 50000)
+            break
+    else:
+        raise AssertionError("metaconfig missing from -X importtime output")
@@ -0,0 +1,69 @@
+from nose.tools import *
+from io import StringIO
+from textwrap import dedent
+
+from metaconfig import Config, CompactMapping, Interner
+
+source = """
+--- !let
+first:
+    - {host: localhost, port: 8080, tags: !!python/tuple [a, b]}
+    - {host: localhost, port: 8080, tags: !!python/tuple [a, b]}
+second: &shared {host: example, weights: [0.0, -0.0, 1.5, 1.5]}
+third: *shared
+...
+"""
+
+def load(interner, mapping=None):
+    config = Config(interner=interner, mapping=mapping)
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+    return config
+
+def test_scalars():
+    interner = Interner()
+    config = load(interner)
+
+    left, right = config.get("first")
+    assert_is_not(left, right)
+    assert_is(list(left)[0], list(right)[0])
+    assert_is(left["host"], right["host"])
+    assert_is(left["tags"], right["tags"])
+
+    weights = config.get("second")["weights"]
+    assert_is(weights[2], weights[3])
+    assert_equal(str(weights[1]), "-0.0")
+
+def test_aliases():
+    config = load(Interner())
+
+    assert_is(config.get("second"), config.get("third"))
+
+def test_subtrees():
+    interner = Interner()
+    config = load(interner, mapping=CompactMapping)
+
+    left, right = config.get("first")
+    assert_is(left, right)
+
+    other = load(interner, mapping=CompactMapping)
+    assert_is(other.get("first")[0], left)
+
+    interner.clear()
+    assert_equal(len(interner), 0)
+    assert_is_not(load(interner, mapping=CompactMapping).get("first")[0], left)
+
+def test_equal_not_identical():
+    interner = Interner()
+
+    assert_is(interner((1, "a")), interner((1, "a")))
+    assert_is(type(interner((1.0,))[0]), float)
+    interner((1,))
+    assert_is(type(interner((True,))[0]), bool)
+
+    left = interner(CompactMapping([("a", 1), ("b", 2)]))
+    right = interner(CompactMapping([("b", 2), ("a", 1)]))
+    assert_equal(list(right), ["b", "a"])
+    assert_is_not(left, right)
+
+    assert_is_instance(interner(([],))[0], list)
@@ -0,0 +1,135 @@
+from nose.tools import *
+from io import StringIO
+from textwrap import dedent
+from pathlib import Path
+import tempfile
+
+import yaml
+
+from metaconfig import Config
+
+def load(source):
+    config = Config(lazy=True)
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+    return config
+
+def test_unused_binding():
+
+    source = """
+    --- !let
+    used: 1
+    unused: !resolve metaconfig.tests.missing.module
+    ...
+    """
+
+    config = load(source)
+
+    assert_equal(config.get("used"), 1)
+    assert_raises(ImportError, config.get, "unused")
+
+def test_get_between_bindings():
+
+    source = """
+    --- !declare
+    tuple:
+        type: !resolve builtins.tuple
+        load: !resolve metaconfig.construct_from_value
+    ...
+
+    --- !let
+    first: !get second
+    second: !tuple [1, 2]
+    ...
+    """
+
+    config = load(source)
+
+    assert_equal(config.get("first"), (1, 2))
+    assert_is(config.get("first"), config.get("second"))
+
+def test_recursive_bindings():
+
+    source = """
+    --- !let
+    first: !get second
+    second: !get first
+    ...
+    """
+
+    config = load(source)
+
+    assert_raises(yaml.constructor.ConstructorError, config.get, "first")
+
+def test_declared_at_binding():
+
+    source = """
+    --- !declare
+    value:
+        type: !resolve builtins.tuple
+        load: !resolve metaconfig.construct_from_value
+    ...
+
+    --- !let
+    first: !value [1]
+    ...
+
+    --- !declare
+    value:
+        type: !resolve builtins.list
+        load: !resolve metaconfig.construct_from_value
+    ...
+
+    --- !let
+    second: !value [2]
+    ...
+    """
+
+    config = load(source)
+
+    assert_equal(config.get("second"), [2])
+    assert_equal(config.get("first"), (1,))
+
+def test_failed_binding_fails_again():
+
+    source = """
+    --- !let
+    broken: !resolve metaconfig.tests.missing.module
+    ...
+    """
+
+    config = load(source)
+
+    assert_raises(ImportError, config.get, "broken")
+    assert_raises(ImportError, config.get, "broken")
+
+def test_get_as_declared():
+
+    source = """
+    --- !let
+    x: 1
+    ...
+
+    --- !let
+    y: !get x
+    ...
+
+    --- !let
+    x: 2
+    ...
+    """
+
+    config = load(source)
+
+    assert_equal(config.get("y"), 1)
+    assert_equal(config.get("x"), 2)
+
+def test_load_relative_to_file():
+    with tempfile.TemporaryDirectory() as temp:
+        root = Path(temp)
+        root.joinpath("main.yaml").write_text("--- !let\nx: !load other.yaml\n...\n")
+        root.joinpath("other.yaml").write_text("--- {a: 1}\n")
+        config = Config(lazy=True)
+        config.load(str(root.joinpath("main.yaml")))
+
+        assert_equal(config.get("x"), [{"a": 1}])
@@ -0,0 +1,89 @@
+from nose.tools import *
+from io import StringIO
+from textwrap import dedent
+
+from metaconfig import Config
+
+source = """
+--- !declare
+point:
+    fields: [x, y]
+...
+--- !let
+defaults: &defaults
+    pool: {size: 10}
+services:
+    db:
+        <<: *defaults
+        host: localhost
+        replicas: [a, {name: b/c}]
+    origin: !point [1, 2]
+...
+--- !let
+alias: !get services
+...
+"""
+
+def load(**kwargs):
+    config = Config(**kwargs)
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+    return config
+
+def test_lookup():
+    for lazy in (False, True):
+        config = load(lazy=lazy)
+
+        assert_equal(config.lookup("services.db.pool.size"), 10)
+        assert_equal(config.lookup("/services/db/pool/size"), 10)
+        assert_equal(config.lookup("services.db.replicas.1.name"), "b/c")
+        assert_equal(config.lookup("/services/db/replicas/1/name"), "b/c")
+        assert_equal(config.lookup("services.origin.y"), 2)
+        assert_equal(config.lookup("alias.db.host"), "localhost")
+        assert_is(config.lookup("services.db"), config.get("services")["db"])
+        assert_raises(KeyError, config.lookup, "services.db.port")
+        assert_raises(ValueError, config.where, "services")
+
+def test_invalidation():
+    config = load()
+    assert_equal(config.lookup("services.db.host"), "localhost")
+
+    with StringIO("--- !let\nservices: {db: {host: remote}}\n...\n") as stream:
+        config.load(stream)
+    assert_equal(config.lookup("services.db.host"), "remote")
+    assert_raises(KeyError, config.lookup, "services.db.pool.size")
+
+    config.freeze()
+    assert_equal(config.lookup("services.db"), {"host": "remote"})
+
+def test_where():
+    config = load(marks=True)
+    lines = dedent(source).splitlines()
+
+    def line(text):
+        return [index for index, value in enumerate(lines) if value.startswith(text)][0]
+
+    assert_equal(config.where("services.db.host").line, line("        host:"))
+    assert_equal(config.where("/services/db/replicas/1/name").line, line("        replicas:"))
+    assert_equal(config.where("services.db.pool.size").line, line("    pool:"))
+    assert_equal(config.where("alias.db.host").line, line("alias:"))
+    assert_equal(config.where("services.origin.x").line, line("    origin:"))
+    assert_raises(KeyError, config.where, "missing.key")
+
+def test_unused_bindings():
+    config = Config(lazy=True)
+    with StringIO("--- !let\nused: {a: 1}\nbroken: !resolve metaconfig.tests.missing\n...\n") as stream:
+        config.load(stream)
+
+    assert_equal(config.lookup("used.a"), 1)
+
+def test_shared_values():
+    lines = ["--- !let", "level0: &level0 {value: 1}"]
+    for level in range(1, 20):
+        lines.append("level{0}: &level{0} {{left: *level{1}, right: *level{1}}}".format(
+            level, level - 1))
+    config = Config()
+    with StringIO("\n".join(lines) + "\n...\n") as stream:
+        config.load(stream)
+
+    assert_equal(config.lookup("level19" + ".right" * 19 + ".value"), 1)
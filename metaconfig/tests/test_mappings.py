@@ -0,0 +1,67 @@
+from nose.tools import *
+from collections import OrderedDict
+from io import StringIO
+from textwrap import dedent
+import operator
+import pickle
+
+from metaconfig import Config, CompactMapping
+
+source = """
+--- !declare
+func:
+    type: !resolve metaconfig.tests.utils.identity
+    load: !resolve metaconfig.construct_from_args_kwargs
+...
+
+--- !let
+routes:
+    - {path: /a, port: 1}
+    - {path: /b, port: 2}
+call: !func
+    =: [1, 2]
+    a: {b: 3}
+...
+"""
+
+def load(mapping=None):
+    config = Config(mapping=mapping)
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+    return config
+
+def test_default_dict():
+
+    config = load()
+
+    routes = config.get("routes")
+    assert_is(type(routes[0]), dict)
+    assert_equal(routes[1], {"path": "/b", "port": 2})
+
+def test_ordered_dict():
+
+    config = load(OrderedDict)
+
+    assert_is(type(config.get("routes")[0]), OrderedDict)
+    args, kwargs = config.get("call")
+    assert_is(type(kwargs["a"]), OrderedDict)
+
+def test_compact_mapping():
+
+    config = load(CompactMapping)
+
+    first, second = config.get("routes")
+    assert_is_instance(first, CompactMapping)
+    assert_is(first._shape, second._shape)
+    assert_equal(list(first), ["path", "port"])
+    assert_equal(second["port"], 2)
+    assert_equal(first, {"path": "/a", "port": 1})
+    assert_not_equal(first, second)
+    assert_equal(hash(first), hash(CompactMapping([("path", "/a"), ("port", 1)])))
+    assert_in(CompactMapping([("port", 1), ("path", "/a")]), set([first]))
+    assert_raises(TypeError, operator.setitem, first, "port", 3)
+    assert_equal(pickle.loads(pickle.dumps(first)), first)
+
+    args, kwargs = config.get("call")
+    assert_equal(args, (1, 2))
+    assert_equal(kwargs, {"a": {"b": 3}})
@@ -0,0 +1,56 @@
+import io
+import json
+import unittest
+from pathlib import Path
+
+from metaconfig import Config, LoadMetrics
+from utils import TemporaryFiles
+
+class TestLoadMetrics(TemporaryFiles, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.write("types.yaml", """
+            --- !declare
+            tuple:
+                type: !resolve builtins.tuple
+                load: !resolve metaconfig.construct_from_value
+            ...
+            """)
+        self.write("main.yaml", """
+            --- !load types.yaml
+            --- !let
+            first: !tuple [1]
+            second: !tuple [2]
+            ...
+            """)
+        self.metrics = LoadMetrics()
+        self.config = Config(metrics=self.metrics)
+        self.config.log = lambda text: None
+        self.config.load(str(self.root.joinpath("main.yaml")))
+
+    def test_files(self):
+        self.assertEqual(self.config.get("second"), (2,))
+        files = self.metrics.as_dict()["files"]
+        self.assertEqual(len(files), 1)
+        main = files[0]
+        self.assertEqual(Path(main["file"]).name, "main.yaml")
+        self.assertEqual([Path(entry["file"]).name for entry in main["includes"]], ["types.yaml"])
+        types = main["includes"][0]
+        for phase in ("read", "parse", "construct", "self"):
+            self.assertGreaterEqual(main[phase], 0)
+        self.assertGreaterEqual(main["construct"], types["total"])
+
+    def test_tags(self):
+        tags = self.metrics.as_dict()["tags"]
+        self.assertEqual(tags["!tuple"]["count"], 2)
+        self.assertEqual(tags["!load"]["count"], 1)
+        self.assertEqual(tags["!let"]["count"], 1)
+        self.assertEqual(tags["!resolve"]["count"], 2)
+
+    def test_export(self):
+        self.assertEqual(json.loads(self.metrics.to_json()), self.metrics.as_dict())
+        output = io.StringIO()
+        self.metrics.print_tree(output)
+        lines = output.getvalue().splitlines()
+        self.assertIn("main.yaml", lines[0])
+        self.assertIn("types.yaml", lines[1])
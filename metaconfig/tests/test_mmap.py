@@ -0,0 +1,43 @@
+import unittest
+
+from metaconfig import Config, LoadMetrics, PythonLoader
+from utils import TemporaryFiles
+
+class TestMemoryMap(TemporaryFiles, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.write("empty.yaml", "")
+        self.write("leaf.yaml", """
+            --- !let
+            leaf: "été"
+            ...
+            """)
+        self.write("main.yaml", """
+            --- !load empty.yaml
+            --- !load leaf.yaml
+            --- !let
+            main: !get leaf
+            ...
+            """)
+
+    def create(self, **kwargs):
+        config = Config(memory_map=True, **kwargs)
+        config.log = lambda text: None
+        config.load(str(self.root.joinpath("main.yaml")))
+        return config
+
+    def test_load(self):
+        for kwargs in ({}, {"loader": PythonLoader}, {"metrics": LoadMetrics()}):
+            config = self.create(**kwargs)
+            self.assertEqual(config.get("main"), "été")
+
+    def test_reload(self):
+        config = self.create()
+        self.assertEqual(config.changed_files(), [])
+        self.write("leaf.yaml", """
+            --- !let
+            leaf: 2
+            ...
+            """)
+        self.assertEqual(config.reload(), [self.root.joinpath("leaf.yaml").resolve()])
+        self.assertEqual(config.get("main"), 2)
@@ -0,0 +1,88 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from metaconfig import Config
+from utils import TemporaryFiles
+
+class TestParallel(TemporaryFiles, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.write("types.yaml", """
+            --- !declare
+            tuple:
+                type: !resolve builtins.tuple
+                load: !resolve metaconfig.construct_from_value
+            ...
+            """)
+        for index in range(8):
+            self.write("leaf{0}.yaml".format(index), """
+                --- !load types.yaml
+                --- !let
+                leaf{0}: !tuple [{0}, {0}]
+                shadowed: {0}
+                ...
+                """.format(index))
+        self.write("branch.yaml", "\n".join(
+            "--- !load leaf{0}.yaml".format(index) for index in range(4)))
+        self.write("main.yaml", "\n".join(
+            ["--- !load branch.yaml"]
+            + ["--- !load leaf{0}.yaml".format(index) for index in range(4, 8)]))
+
+    def create(self):
+        config = Config()
+        config.log = lambda text: None
+        return config
+
+    def check(self, config):
+        for index in range(8):
+            self.assertEqual(config.get("leaf{0}".format(index)), (index, index))
+        self.assertEqual(config.get("shadowed"), 7)
+        self.assertEqual(len(config.extra_files), 11)
+
+    def test_serial(self):
+        config = self.create()
+        config.load(str(self.root.joinpath("main.yaml")))
+        self.check(config)
+
+    def test_threads(self):
+        config = self.create()
+        with ThreadPoolExecutor(4) as executor:
+            config.load_parallel(str(self.root.joinpath("main.yaml")), executor)
+        self.check(config)
+
+    def test_processes(self):
+        config = self.create()
+        config.load_parallel(str(self.root.joinpath("main.yaml")))
+        self.check(config)
+
+    def test_aliases(self):
+        self.write("aliases.yaml", """
+            --- !let
+            first: &shared {a: [1, 2]}
+            second: *shared
+            ...
+            """)
+        config = self.create()
+        config.load_parallel(str(self.root.joinpath("aliases.yaml")))
+        self.assertEqual(config.get("first"), {"a": [1, 2]})
+        self.assertIs(config.get("first"), config.get("second"))
+
+    def test_get_path_override(self):
+        opened = []
+
+        class UnresolvedConfig(Config):
+            def get_path(self, relative):
+                return self.peek_frame().dirpath.joinpath(relative)
+
+            def open_file(self, path):
+                opened.append(path)
+                return super().open_file(path)
+
+        config = UnresolvedConfig()
+        config.log = lambda text: None
+        self.root.joinpath("sub").mkdir()
+        with ThreadPoolExecutor(4) as executor:
+            config.load_parallel(str(self.root.joinpath("sub", "..", "main.yaml")), executor)
+        self.check(config)
+        self.assertEqual(len(opened), len(set(opened)))
+        self.assertEqual(config._prefetched, {})
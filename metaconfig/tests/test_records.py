@@ -0,0 +1,73 @@
+from nose.tools import *
+from io import StringIO
+from textwrap import dedent
+import yaml
+
+from metaconfig import Config, Record, record_type
+
+source = """
+--- !declare
+route:
+    fields: [path, backend, {port: 80}, {tags: []}]
+...
+--- !let
+defaults: &defaults
+    backend: pool
+first: !route
+    path: /api
+    backend: pool1
+    port: 8080
+second: !route
+    <<: *defaults
+    path: /static
+third: !route [/health, pool2, 81]
+...
+"""
+
+def load(source):
+    config = Config()
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+    return config
+
+def test_declare():
+    config = load(source)
+
+    first = config.get("first")
+    assert_is_instance(first, Record)
+    assert_equal((first.path, first.backend, first.port, first.tags),
+        ("/api", "pool1", 8080, []))
+    assert_false(hasattr(first, "__dict__"))
+
+    second = config.get("second")
+    assert_equal(second._asdict(), {"path": "/static", "backend": "pool", "port": 80, "tags": []})
+
+    third = config.get("third")
+    assert_equal(repr(third), "route(path='/health', backend='pool2', port=81, tags=[])")
+
+    assert_is(type(load(source).get("first")), type(first))
+    assert_equal(load(source).get("first"), first)
+    assert_not_equal(second, first)
+
+def test_errors():
+    for fields, message in (
+            ("    path: /api\n    host: x\n", "found unknown field 'host'"),
+            ("    port: 1\n", "missing field 'path'")):
+        text = source + "--- !let\nbad: !route\n" + fields + "...\n"
+        with assert_raises(yaml.constructor.ConstructorError) as context:
+            load(text)
+        assert_in(message, str(context.exception))
+
+    assert_raises(ValueError, record_type, "pair", ["left", "left"])
+
+def test_record_type():
+    Point = record_type("Point", ["x", {"y": 0}])
+
+    assert_is(record_type("Point", ["x", {"y": 0}]), Point)
+    assert_equal(Point(1), Point(x=1, y=0))
+    assert_equal(Point(1, 2)._asdict(), {"x": 1, "y": 2})
+    assert_raises(TypeError, Point)
+    assert_raises(TypeError, Point, 1, x=2)
+    assert_raises(TypeError, Point, 1, z=2)
+    assert_raises(TypeError, Point, 1, 2, 3)
+    assert_raises(TypeError, hash, Point(1))
@@ -0,0 +1,96 @@
+import unittest
+import threading
+
+from metaconfig import Config, ConfigWatcher
+from utils import TemporaryFiles
+
+class TestReload(TemporaryFiles, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.write("leaf.yaml", """
+            --- !let
+            leaf: 1
+            ...
+            """)
+        self.write("sibling.yaml", """
+            --- !let
+            sibling: 1
+            ...
+            """)
+        self.write("branch.yaml", """
+            --- !load leaf.yaml
+            --- !let
+            branch: !get leaf
+            ...
+            """)
+        self.write("main.yaml", """
+            --- !load branch.yaml
+            --- !load sibling.yaml
+            """)
+
+    def path(self, name):
+        return self.root.joinpath(name).resolve()
+
+    def create(self):
+        config = Config()
+        config.log = lambda text: None
+        config.load(str(self.root.joinpath("main.yaml")))
+        return config
+
+    def test_unchanged(self):
+        config = self.create()
+        self.assertEqual(config.changed_files(), [])
+        self.assertEqual(config.reload(), [])
+
+    def test_touched(self):
+        config = self.create()
+        self.write("leaf.yaml", """
+            --- !let
+            leaf: 1
+            ...
+            """)
+        self.assertEqual(config.reload(), [])
+
+    def test_reload(self):
+        config = self.create()
+        sibling = config.get_frame(self.path("sibling.yaml"))
+        leaf = config.get_frame(self.path("leaf.yaml"))
+        self.write("leaf.yaml", """
+            --- !let
+            leaf: 2
+            ...
+            """)
+        self.assertEqual(config.reload(), [self.path("leaf.yaml")])
+        self.assertEqual(config.get("leaf"), 2)
+        self.assertEqual(config.get("branch"), 2)
+        self.assertIs(config.get_frame(self.path("sibling.yaml")), sibling)
+        self.assertIsNot(config.get_frame(self.path("leaf.yaml")), leaf)
+        self.assertEqual(len(config.extra_files), 4)
+
+    def test_removed_binding(self):
+        config = self.create()
+        self.write("sibling.yaml", """
+            --- !let
+            other: 1
+            ...
+            """)
+        config.reload()
+        self.assertEqual(config.get("other"), 1)
+        with self.assertRaises(KeyError):
+            config.get("sibling")
+
+    def test_watcher(self):
+        config = self.create()
+        reloaded = threading.Event()
+        watcher = ConfigWatcher(config, 0.01, lambda changed: reloaded.set())
+        watcher.start()
+        try:
+            self.write("sibling.yaml", """
+                --- !let
+                sibling: 2
+                ...
+                """)
+            self.assertTrue(reloaded.wait(5))
+        finally:
+            watcher.stop()
+        self.assertEqual(config.get("sibling"), 2)
@@ -0,0 +1,45 @@
+from nose.tools import *
+import os.path
+from io import StringIO
+from textwrap import dedent
+
+from metaconfig import Config, Resolver, LazyObject
+
+def test_shared_cache():
+
+    resolver = Resolver()
+
+    assert_is(resolver.resolve("os.path.join"), resolver.resolve("os.path.join"))
+    report = dict(resolver.report())
+    assert_equal(list(report), ["os.path.join"])
+    assert_greater_equal(report["os.path.join"], 0)
+
+def test_lazy_resolve():
+
+    source = """
+    --- !declare
+    tuple:
+        type: !resolve builtins.tuple
+        load: !resolve metaconfig.construct_from_value
+    ...
+
+    --- !let
+    value: !tuple [1, 2]
+    join: !resolve os.path.join
+    ...
+    """
+
+    resolver = Resolver()
+    config = Config(resolver=resolver, lazy_resolve=True)
+
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+
+    assert_equal(config.get("value"), (1, 2))
+    assert_equal(set(dict(resolver.report())), {"builtins.tuple", "metaconfig.construct_from_value"})
+
+    join = config.get("join")
+    assert_is_instance(join, LazyObject)
+    assert_equal(join.__name__, "join")
+    assert_equal(join("a", "b"), os.path.join("a", "b"))
+    assert_in("os.path.join", dict(resolver.report()))
@@ -0,0 +1,93 @@
+from nose.tools import *
+from io import StringIO
+from textwrap import dedent
+
+from metaconfig import Config, Schema, SchemaError, compile_schema
+
+source = """
+--- !declare
+server:
+    type: !resolve metaconfig.tests.utils.identity
+    schema:
+        host: str
+        port: int
+        tags?: [str]
+        limits?:
+            "*": int|float
+...
+--- !let
+good: !server
+    host: localhost
+    port: 8080
+    tags: [a, b]
+    limits: {cpu: 0.5, memory: 512}
+...
+"""
+
+def load(source):
+    config = Config()
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+    return config
+
+def test_declare():
+    config = load(source)
+
+    args, kwargs = config.get("good")
+    assert_tuple_equal(args, ())
+    assert_dict_equal(kwargs, {"host": "localhost", "port": 8080, "tags": ["a", "b"],
+        "limits": {"cpu": 0.5, "memory": 512}})
+
+def test_errors():
+    cases = [
+        ("    port: true\n", "port: expected int, but found bool", "    port"),
+        ("    port: 80\n    tags: [a, 1]\n", "tags[]: expected str, but found int", "    tags"),
+        ("    port: 80\n    limits: {cpu: high}\n", "limits.*: expected int|float", "    limits"),
+        ("    port: 80\n    debug: true\n", "unexpected key 'debug'", "    debug"),
+        ("", "missing key 'port'", "bad"),
+    ]
+    for fields, message, start in cases:
+        text = source + "--- !let\nbad: !server\n    host: localhost\n" + fields + "...\n"
+        with assert_raises(SchemaError) as context:
+            load(text)
+        error = context.exception
+        assert_in(message, str(error))
+        lines = text.splitlines()
+        line = max(index for index, value in enumerate(lines) if value.startswith(start))
+        assert_equal(error.problem_mark.line, line)
+
+def test_python_api():
+    spec = {"name": "str", "ports": ["int"], "extra?": "any"}
+    config = Config()
+    schema = config.add_schema("service", spec)
+
+    assert_is(schema, compile_schema(dict(spec)))
+    assert_is(Config().add_schema("other", spec), schema)
+
+    with StringIO("--- !let\nweb: !service {name: web, ports: [80, 443]}\n...\n") as stream:
+        config.load(stream)
+    assert_dict_equal(config.get("web"), {"name": "web", "ports": [80, 443]})
+
+    with assert_raises(SchemaError):
+        with StringIO("--- !let\nweb: !service {name: web, ports: 80}\n...\n") as stream:
+            config.load(stream)
+
+def test_constructed_values():
+    config = Config()
+    config.add_schema("service", {"ports": ["int"]})
+
+    with StringIO(dedent("""
+    --- !let
+    base: [1, 2]
+    ...
+    --- !let
+    good: !service {ports: !get base}
+    ...
+    """)) as stream:
+        config.load(stream)
+    assert_dict_equal(config.get("good"), {"ports": [1, 2]})
+
+    schema = Schema({"a": "int", "b?": ["str|null"]})
+    assert_dict_equal(schema.validate({"a": 1, "b": ["x", None]}), {"a": 1, "b": ["x", None]})
+    assert_raises(SchemaError, schema.validate, {"b": []})
+    assert_raises(ValueError, Schema, {"a": "integer"})
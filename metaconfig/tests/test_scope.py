@@ -0,0 +1,88 @@
+import unittest
+
+import yaml
+
+from metaconfig import Config
+from metaconfig.core import ConstructorScope
+from utils import TemporaryFiles
+
+class TestConstructorScope(unittest.TestCase):
+    def setUp(self):
+        self.base = {"tag:str": "str"}
+
+    def create(self):
+        scope = ConstructorScope(self.base)
+        scope.set_core("!let", "let")
+        return scope
+
+    def test_lookup_order(self):
+        scope = self.create()
+        self.assertIn("tag:str", scope)
+        self.assertEqual(scope["!let"], "let")
+        self.assertNotIn("!type", scope)
+        scope.declare("!type", "type")
+        self.assertEqual(scope["!type"], "type")
+        with self.assertRaises(KeyError):
+            scope["!other"]
+
+    def test_grab_order(self):
+        parent = self.create()
+        child = self.create()
+        parent.declare("!type", "parent")
+        child.declare("!type", "child")
+        parent.grab(child)
+        self.assertEqual(parent["!type"], "child")
+        parent.declare("!type", "redeclared")
+        self.assertEqual(parent["!type"], "redeclared")
+        parent.grab(child)
+        self.assertEqual(parent["!type"], "child")
+
+    def test_private(self):
+        parent = self.create()
+        child = self.create()
+        child.declare("!let", "private let")
+        child.declare("tag:str", "private str")
+        self.assertEqual(child["!let"], "private let")
+        self.assertEqual(child["tag:str"], "private str")
+        parent.grab(child)
+        self.assertEqual(parent["!let"], "let")
+        self.assertEqual(parent["tag:str"], "str")
+
+    def test_transitive(self):
+        root = self.create()
+        middle = self.create()
+        leaf = self.create()
+        leaf.declare("!leaf", "leaf")
+        middle.grab(leaf)
+        middle.declare("!middle", "middle")
+        root.grab(middle)
+        self.assertEqual(root["!leaf"], "leaf")
+        self.assertEqual(root["!middle"], "middle")
+
+    def test_cycle(self):
+        first = self.create()
+        second = self.create()
+        first.declare("!first", "first")
+        first.grab(second)
+        second.grab(first)
+        self.assertEqual(second["!first"], "first")
+        self.assertEqual(first["tag:str"], "str")
+        self.assertNotIn("!other", first)
+        self.assertNotIn("!other", second)
+
+class TestMutualIncludes(TemporaryFiles, unittest.TestCase):
+    def load(self, first):
+        self.write("a.yaml", "--- !load b.yaml\n" + first)
+        self.write("b.yaml", "--- !load a.yaml\n")
+        config = Config()
+        config.log = lambda text: None
+        config.load(str(self.root.joinpath("a.yaml")))
+        return config
+
+    def test_mutual_includes(self):
+        config = self.load("--- !let {y: 1.5}\n")
+        self.assertEqual(config.get("y"), 1.5)
+
+    def test_unknown_tag(self):
+        with self.assertRaises(yaml.constructor.ConstructorError):
+            self.load("--- !let {y: !unknown 1}\n")
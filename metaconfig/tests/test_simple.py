@@ -2,7 +2,7 @@ from nose.tools import *
 from io import StringIO
 from textwrap import dedent
 
-from metaconfig import Config
+from metaconfig import Config, PythonLoader
 
 def test_declare_empty():
 
@@ -88,3 +88,29 @@ def test_declare_get():
     assert_equals(10, config.get("value"))
     assert_is_instance(config.get("value"), int)
     assert_equals(1, config.get("value").one)
+
+def test_python_loader():
+
+    source = """
+    --- !declare
+    type:
+        type: !resolve builtins.type
+        load: !resolve metaconfig.construct_from_sequence
+    ...
+
+    --- !let
+    integer: !type 
+        - 0
+    mapping:
+        b: 1
+        a: 2
+    ...
+    """
+
+    config = Config(loader=PythonLoader)
+
+    with StringIO(dedent(source)) as stream:
+        config.load(stream)
+
+    assert_is(int, config.get("integer"))
+    assert_list_equal(list(config.get("mapping").items()), [("b", 1), ("a", 2)])
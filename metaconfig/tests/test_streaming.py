@@ -0,0 +1,64 @@
+from nose.tools import *
+from io import StringIO
+from textwrap import dedent
+
+from metaconfig import Config
+
+def test_iter_documents():
+
+    source = """
+    --- !declare
+    tuple:
+        type: !resolve builtins.tuple
+        load: !resolve metaconfig.construct_from_value
+    ...
+
+    --- !let
+    first: !tuple [1]
+    ...
+
+    --- !tuple [2]
+
+    --- !let
+    second: !get first
+    ...
+
+    --- [3, 4]
+    """
+
+    config = Config()
+    config.log = lambda text: None
+
+    with StringIO(dedent(source)) as stream:
+        documents = config.iter_documents(stream)
+        next(documents)
+        assert_raises(KeyError, config.get, "first")
+        assert_equal(next(documents), None)
+        assert_equal(next(documents), (2,))
+        assert_equal(list(documents), [None, [3, 4]])
+
+    assert_equal(config.get("first"), (1,))
+    assert_is(config.get("second"), config.get("first"))
+
+def test_abandoned_iteration():
+
+    source = """
+    --- !let
+    first: 1
+    ...
+
+    --- !let
+    second: 2
+    ...
+    """
+
+    config = Config()
+    config.log = lambda text: None
+
+    with StringIO(dedent(source)) as stream:
+        documents = config.iter_documents(stream)
+        next(documents)
+        documents.close()
+
+    assert_equal(len(config._stack), 1)
+    assert_raises(KeyError, config.get, "first")
@@ -0,0 +1,180 @@
+import unittest
+import threading
+import time
+from pathlib import Path
+
+from metaconfig import Config
+from utils import TemporaryFiles
+
+THREADS = 16
+
+class TestThreads(TemporaryFiles, unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.write("common.yaml", """
+            --- !declare
+            func:
+                type: !resolve metaconfig.tests.utils.identity
+                load: !resolve metaconfig.construct_from_sequence
+            --- !let
+            common: !func [1, 2]
+            ...
+            """)
+        for index in range(THREADS):
+            self.write("part{0}.yaml".format(index), """
+                --- !load common.yaml
+                --- !let
+                part{0}: !func [{0}]
+                common{0}: !get common
+                ...
+                """.format(index))
+
+    def run_threads(self, target):
+        barrier = threading.Barrier(THREADS)
+        errors = []
+
+        def run(index):
+            barrier.wait()
+            try:
+                target(index)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=run, args=(index,)) for index in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_concurrent_loads(self):
+        for attempt in range(5):
+            config = Config(lazy=bool(attempt % 2))
+            loaded = []
+            config.log = loaded.append
+            self.run_threads(lambda index: config.load(
+                str(self.root.joinpath("part{0}.yaml".format(index)))))
+
+            self.assertEqual(loaded.count("Loading config: {0}".format(
+                self.root.joinpath("common.yaml").resolve())), 1)
+            common = config.get("common")
+            for index in range(THREADS):
+                self.assertEqual(config.get("part{0}".format(index)), ((index,), {}))
+                self.assertIs(config.get("common{0}".format(index)), common)
+            self.assertEqual(len(config._stack), 1)
+
+    def test_readers_see_whole_loads(self):
+        config = Config()
+        config.log = lambda text: None
+        stop = threading.Event()
+
+        def read(index):
+            while not stop.is_set():
+                try:
+                    part = config.get("part{0}".format(index % 4))
+                except KeyError:
+                    continue
+                # A published part always comes with its common bindings.
+                self.assertIsNotNone(config.get("common{0}".format(index % 4)))
+                self.assertEqual(part, ((index % 4,), {}))
+
+        def load(index):
+            if index == 0:
+                try:
+                    config.load(str(self.root.joinpath("part0.yaml")))
+                finally:
+                    stop.set()
+            elif index < 4:
+                config.load(str(self.root.joinpath("part{0}.yaml".format(index))))
+            else:
+                read(index)
+
+        self.run_threads(load)
+
+    def test_crossed_includes(self):
+        self.write("a.yaml", """
+            --- !load b.yaml
+            --- !let
+            a: 1
+            ...
+            """)
+        self.write("b.yaml", """
+            --- !load a.yaml
+            --- !let
+            b: 2
+            ...
+            """)
+        barrier = threading.Barrier(2)
+
+        class CrossedConfig(Config):
+            # Both roots are claimed before either include is looked at.
+            def open_file(self, path):
+                if threading.current_thread().name == Path(path).stem:
+                    barrier.wait(5)
+                return super().open_file(path)
+
+        config = CrossedConfig()
+        config.log = lambda text: None
+        errors = []
+
+        def load(name):
+            try:
+                config.load(str(self.root.joinpath(name + ".yaml")))
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=load, args=(name,), name=name)
+            for name in ("a", "b")]
+        for thread in threads:
+            thread.daemon = True
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(errors, [])
+        self.assertEqual((config.get("a"), config.get("b")), (1, 2))
+
+    def test_load_from_lazy_binding(self):
+        self.write("a.yaml", """
+            --- !let
+            x: !load b.yaml
+            ...
+            """)
+        self.write("b.yaml", """
+            --- !let
+            y: 1
+            ...
+            --- [!get y]
+            """)
+        opened = threading.Event()
+
+        class SlowConfig(Config):
+            # b.yaml is claimed by the loader thread until the binding
+            # loading it waits for it.
+            def open_file(self, path):
+                if threading.current_thread().name == "loader":
+                    opened.set()
+                    time.sleep(0.2)
+                return super().open_file(path)
+
+        config = SlowConfig(lazy=True)
+        config.log = lambda text: None
+        config.load(str(self.root.joinpath("a.yaml")))
+        results = []
+
+        # The binding waits for b.yaml while holding nothing the loader
+        # thread needs for the lazy bindings of b.yaml.
+        def force():
+            opened.wait(5)
+            results.append(config.get("x"))
+
+        threads = [threading.Thread(target=config.load, args=(str(self.root.joinpath("b.yaml")),),
+            name="loader"), threading.Thread(target=force)]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+            self.assertFalse(thread.is_alive())
+        self.assertEqual(results, [[None, [1]]])
@@ -0,0 +1,125 @@
+from nose.tools import *
+from io import StringIO
+import operator
+import sys
+
+from metaconfig.tools import Constant, Function, Try, AdaptiveTry, Evaluator
+
+class Counter(object):
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+    def __call__(self, *args):
+        self.calls += 1
+        return self.func(*args)
+
+def fail(*args):
+    raise ValueError(args)
+
+def test_same_results():
+    impure = Counter(lambda: 5)
+    tree = Function(operator.add,
+        Function(operator.mul, Constant(2), Constant(3), pure=True),
+        Try(Function(fail, Constant(1)), Function(impure), Constant(0)))
+
+    assert_equal(tree(), 11)
+    evaluator = tree.compile()
+    assert_equal(evaluator(), 11)
+    assert_equal(evaluator(), 11)
+    assert_equal(impure.calls, 3)
+    assert_is_none(Try(Function(fail)).compile()())
+
+def test_constant_folding():
+    pure = Counter(operator.add)
+    impure = Counter(operator.add)
+    tree = Function(operator.neg,
+        Function(impure, Function(pure, Constant(1), Constant(2), pure=True), Constant(3)))
+
+    evaluator = Evaluator(tree)
+    assert_equal(pure.calls, 1)
+    assert_equal([evaluator() for _ in range(3)], [-6, -6, -6])
+    assert_equal(pure.calls, 1)
+    assert_equal(impure.calls, 3)
+
+def test_failing_constant_folding():
+    primitive = Try(Function(int, Constant("x"), pure=True), Constant(0))
+
+    assert_equal(primitive(), 0)
+    assert_equal(primitive.compile()(), 0)
+    assert_raises(ValueError, Function(int, Constant("x"), pure=True).compile())
+
+def test_memoization():
+    source = Counter(lambda: source.value)
+    square = Counter(lambda value: value * value)
+    evaluator = Evaluator(Function(square, Function(source), pure=True))
+
+    for value in (2, 3, 2, 3):
+        source.value = value
+        assert_equal(evaluator(), value * value)
+    assert_equal(square.calls, 2)
+
+    source.value = [1]
+    unhashable = Evaluator(Function(len, Function(source), pure=True))
+    assert_equal(unhashable(), 1)
+
+def test_deep_tree():
+    tree = Constant(0)
+    for _ in range(sys.getrecursionlimit() * 2):
+        tree = Function(operator.add, tree, Function(lambda: 1))
+    assert_equal(Evaluator(tree)(), sys.getrecursionlimit() * 2)
+
+def test_profile():
+    impure = Counter(lambda: 1)
+    tree = Function(operator.add, Function(impure), Function(abs, Constant(-1), pure=True))
+    evaluator = tree.compile(profile=True)
+    assert_equal(evaluator(), 2)
+    assert_equal(evaluator(), 2)
+
+    report = evaluator.report()
+    calls = dict((node.func, count) for node, count, seconds in report)
+    assert_equal(calls, {impure: 2, abs: 2, operator.add: 2})
+
+    output = StringIO()
+    evaluator.print_report(output)
+    assert_equal(len(output.getvalue().splitlines()), 3)
+
+def test_adaptive_try():
+    accelerated = Counter(fail)
+    fallback = Counter(lambda: "slow")
+    node = AdaptiveTry(Function(accelerated), Function(fallback))
+
+    assert_equal([node() for _ in range(3)], ["slow"] * 3)
+    assert_equal(accelerated.calls, 1)
+    assert_is(node.winner, node.funcs[1])
+    assert_false(node.pinned)
+
+    stats = node.stats()
+    assert_equal([(item["successes"], item["failures"]) for item in stats], [(0, 1), (3, 0)])
+
+    compiled = Function(str.upper, node).compile()
+    assert_equal(compiled(), "SLOW")
+    assert_equal(accelerated.calls, 1)
+    assert_equal(node.stats()[1]["successes"], 4)
+    assert_is_none(AdaptiveTry(Function(fail))())
+
+def test_adaptive_try_pinning():
+    state = {"fail": False}
+    def flaky():
+        if state["fail"]:
+            raise ValueError()
+        return "first"
+    node = AdaptiveTry(flaky, lambda: "second", pin_after=2)
+
+    assert_equal([node(), node()], ["first", "first"])
+    assert_true(node.pinned)
+    assert_equal(node(), "first")
+    assert_equal(node.stats()[0]["successes"], 3)
+
+    state["fail"] = True
+    assert_equal(node(), "second")
+    assert_false(node.pinned)
+    assert_equal(node.stats()[0]["failures"], 1)
+    assert_is(node.winner, node.funcs[1])
+
+    state["fail"] = False
+    assert_equal(node(), "second")
@@ -1,5 +1,9 @@
 from fs import memoryfs 
 from collections import abc
+from textwrap import dedent
+from pathlib import Path
+import tempfile
+import os
 
 def identity(*args, **kwargs):
     return args, kwargs
@@ -21,3 +25,29 @@ def mock_filesystem(declaration):
     fill_directory(declaration, fs.opendir('/'))
     return fs
 
+
+class TemporaryFiles(object):
+    """
+    Test case mixin giving every test an empty temporary directory, `root`,
+    to `write` config files into.
+    """
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp.name)
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    def write(self, name, source):
+        path = self.root.joinpath(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(dedent(source), encoding="utf-8")
+        self.touch(name)
+        return path
+
+    def touch(self, name):
+        # Files rewritten within the resolution of the file system clock
+        # still get a new signature.
+        path = self.root.joinpath(name)
+        stat = path.stat()
+        os.utime(str(path), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
@@ -1,5 +1,16 @@
 from abc import abstractmethod, ABCMeta
-import collections
+from collections.abc import Callable
+import sys
+import time
+
+__all__ = [
+    'Primitive',
+    'Constant',
+    'Function',
+    'Try',
+    'AdaptiveTry',
+    'Evaluator',
+]
 
 class Primitive(metaclass=ABCMeta):
     """
@@ -8,6 +19,9 @@ class Primitive(metaclass=ABCMeta):
     @abstractmethod
     def __call__(self): pass
 
+    def compile(self, profile=False):
+        return Evaluator(self, profile=profile)
+
 class Constant(Primitive):
     def __init__(self, value):
         assert not isinstance(value, Primitive)
@@ -16,19 +30,25 @@ class Constant(Primitive):
         return self.value
 
 class Function(Primitive):
-    def __init__(self, func, *args):
-        assert isinstance(func, collections.Callable), func
+    """
+    Calls `func` with the values of `args`. A `pure` function always
+    returns the same result for the same arguments and has no side
+    effects, which lets `Evaluator` fold and memoize it.
+    """
+    def __init__(self, func, *args, pure=False):
+        assert isinstance(func, Callable), func
         self.func = func
         for value in args:
             assert isinstance(value, Primitive)
         self.args = args
+        self.pure = pure
     def __call__(self):
         return self.func(*(arg() for arg in self.args))
 
 class Try(Primitive):
     def __init__(self, *funcs):
         for func in funcs:
-            assert isinstance(func, collections.Callable)
+            assert isinstance(func, Callable)
         self.funcs = funcs
     def __call__(self):
         for func in self.funcs:
@@ -37,3 +57,251 @@ class Try(Primitive):
             except Exception:
                 continue
 
+def _invoke(func):
+    return func()
+
+class AdaptiveTry(Try):
+    """
+    `Try` starting with the branch that succeeded last, so an alternative
+    that keeps failing stops costing an exception per call. Once the same
+    branch succeeded `pin_after` times in a row it is pinned: it is called
+    without timing it until it fails, which unpins it.
+
+    Unlike `Try` an earlier branch that starts succeeding again is only
+    picked up once the current winner fails.
+    """
+    def __init__(self, *funcs, pin_after=None):
+        super().__init__(*funcs)
+        self.pin_after = pin_after
+        self._winner = None
+        self._streak = 0
+        self._order = tuple(range(len(funcs)))
+        self._stats = [[0, 0, 0.0] for func in funcs]
+
+    @property
+    def winner(self):
+        return None if self._winner is None else self.funcs[self._winner]
+
+    @property
+    def pinned(self):
+        return self.pin_after is not None and self._streak >= self.pin_after
+
+    def __call__(self):
+        return self.attempt(self.funcs, _invoke)
+
+    def attempt(self, branches, run):
+        """
+        Runs the branches in the current order with `run(branch)`, where
+        `branches` are the `funcs` or the form `Evaluator` compiled them to.
+        """
+        failed = None
+        if self.pinned:
+            try:
+                value = run(branches[self._winner])
+            except Exception:
+                failed = self._winner
+                self._stats[failed][1] += 1
+                self._streak = 0
+            else:
+                self._stats[self._winner][0] += 1
+                return value
+        for index in self._order:
+            if index == failed:
+                continue
+            stats = self._stats[index]
+            start = time.perf_counter()
+            try:
+                value = run(branches[index])
+            except Exception:
+                stats[1] += 1
+                stats[2] += time.perf_counter() - start
+                if index == self._winner:
+                    self._streak = 0
+                continue
+            stats[0] += 1
+            stats[2] += time.perf_counter() - start
+            if index == self._winner:
+                self._streak += 1
+            else:
+                self._winner = index
+                self._streak = 1
+                self._order = (index,) + tuple(
+                    other for other in range(len(branches)) if other != index)
+            return value
+
+    def stats(self):
+        """
+        Successes, failures and seconds spent in each branch, in the order
+        of `funcs`. Calls made while pinned are counted but not timed.
+        """
+        return [{"branch": func, "successes": successes, "failures": failures,
+                 "seconds": seconds}
+            for func, (successes, failures, seconds) in zip(self.funcs, self._stats)]
+
+_PUSH, _CALL, _CALL_CONSTANT, _MEMO, _TRY, _OTHER = range(6)
+
+class Evaluator(object):
+    """
+    `Primitive` tree compiled into a flat program run on a value stack, so
+    deep trees do not recurse in Python.
+
+    Pure functions of constants are evaluated once while compiling, pure
+    functions of other values remember their results by arguments (which
+    must be hashable to be remembered, the memo is unbounded). Functions
+    of constants only are called with a prepared argument tuple. Each
+    branch of a `Try` is a program of its own.
+
+    With `profile` every function node counts its calls and the time
+    spent in its own `func`, see `report`.
+    """
+    def __init__(self, primitive, profile=False):
+        self._primitive = primitive
+        self._profile = profile
+        self._stats = {}
+        self._program = self._compile(primitive)
+
+    def _compile(self, primitive):
+        program = []
+        # Post-order walk, a function is seen twice: first to queue its
+        # arguments, then, ready, to emit its call after theirs.
+        pending = [(False, primitive)]
+        while pending:
+            ready, node = pending.pop()
+            if isinstance(node, Constant):
+                program.append((_PUSH, node.value, None, node))
+            elif isinstance(node, Function):
+                if not ready:
+                    pending.append((True, node))
+                    pending.extend((False, arg) for arg in reversed(node.args))
+                    continue
+                self._emit_function(program, node)
+            elif isinstance(node, Try):
+                branches = tuple(self._compile(func) for func in node.funcs)
+                adaptive = node if isinstance(node, AdaptiveTry) else None
+                program.append((_TRY, branches, adaptive, node))
+            else:
+                program.append((_OTHER, node, None, node))
+        return tuple(program)
+
+    def _emit_function(self, program, node):
+        count = len(node.args)
+        constants = count == 0 or all(op == _PUSH for op, _, _, _ in program[-count:])
+        if constants:
+            args = tuple(value for _, value, _, _ in program[len(program) - count:])
+            del program[len(program) - count:]
+            if node.pure and not self._profile:
+                try:
+                    value = node.func(*args)
+                except Exception:
+                    # Raised when called instead, where a `Try` catches it.
+                    program.append((_CALL_CONSTANT, node.func, args, node))
+                else:
+                    program.append((_PUSH, value, None, node))
+            else:
+                program.append((_CALL_CONSTANT, node.func, args, node))
+        elif node.pure:
+            program.append((_MEMO, node.func, (count, {}), node))
+        else:
+            program.append((_CALL, node.func, count, node))
+
+    def __call__(self):
+        if self._profile:
+            return self._run_profiled(self._program)
+        return self._run(self._program)
+
+    def _run(self, program):
+        stack = []
+        push = stack.append
+        for op, target, extra, node in program:
+            if op is _PUSH:
+                push(target)
+            elif op is _CALL_CONSTANT:
+                push(target(*extra))
+            elif op is _CALL:
+                if extra:
+                    args = stack[-extra:]
+                    del stack[-extra:]
+                    push(target(*args))
+                else:
+                    push(target())
+            elif op is _MEMO:
+                count, memo = extra
+                args = tuple(stack[-count:])
+                del stack[-count:]
+                try:
+                    value = memo[args]
+                except KeyError:
+                    value = memo[args] = target(*args)
+                except TypeError:
+                    value = target(*args)
+                push(value)
+            elif op is _TRY:
+                if extra is None:
+                    push(self._run_try(target, self._run))
+                else:
+                    push(extra.attempt(target, self._run))
+            else:
+                push(target())
+        return stack[-1]
+
+    def _run_try(self, branches, run):
+        for branch in branches:
+            try:
+                return run(branch)
+            except Exception:
+                continue
+
+    def _run_profiled(self, program):
+        stack = []
+        for op, target, extra, node in program:
+            if op is _PUSH:
+                stack.append(target)
+                continue
+            if op is _TRY:
+                if extra is None:
+                    stack.append(self._run_try(target, self._run_profiled))
+                else:
+                    stack.append(extra.attempt(target, self._run_profiled))
+                continue
+            memo = None
+            if op is _CALL_CONSTANT:
+                args = extra
+            elif op is _CALL or op is _MEMO:
+                count = extra if op is _CALL else extra[0]
+                args = tuple(stack[len(stack) - count:])
+                del stack[len(stack) - count:]
+                if op is _MEMO:
+                    memo = extra[1]
+                    try:
+                        if args in memo:
+                            stack.append(memo[args])
+                            continue
+                    except TypeError:
+                        memo = None
+            else:
+                args = ()
+            stats = self._stats.setdefault(id(node), [node, 0, 0.0])
+            start = time.perf_counter()
+            try:
+                value = target(*args)
+            finally:
+                stats[1] += 1
+                stats[2] += time.perf_counter() - start
+            if memo is not None:
+                memo[args] = value
+            stack.append(value)
+        return stack[-1]
+
+    def report(self):
+        """
+        `(node, calls, seconds)` of every profiled function node, most
+        time consuming first.
+        """
+        return sorted((tuple(stats) for stats in self._stats.values()),
+            key=lambda item: item[2], reverse=True)
+
+    def print_report(self, file=None):
+        file = sys.stdout if file is None else file
+        for node, calls, seconds in self.report():
+            name = getattr(getattr(node, "func", node), "__qualname__", repr(node))
+            print("{0:10.3f}ms {1:8d}x  {2}".format(seconds * 1000, calls, name), file=file)
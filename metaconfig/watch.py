@@ -0,0 +1,44 @@
+import threading
+
+__all__ = [
+    'ConfigWatcher',
+]
+
+class ConfigWatcher(threading.Thread):
+    """
+    Daemon thread polling a `Config` every `interval` seconds and calling
+    `reload` on it. `callback` receives the list of changed paths, `errback`
+    the exception raised by a failed reload.
+    """
+    def __init__(self, config, interval=1.0, callback=None, errback=None):
+        super().__init__(daemon=True)
+        self._config = config
+        self._interval = interval
+        self._callback = callback
+        self._errback = errback
+        self._stopped = threading.Event()
+
+    @property
+    def config(self):
+        return self._config
+
+    def poll(self):
+        try:
+            changed = self._config.reload()
+        except Exception as exc:
+            if self._errback is None:
+                raise
+            self._errback(exc)
+            return []
+        if changed and self._callback is not None:
+            self._callback(changed)
+        return changed
+
+    def run(self):
+        while not self._stopped.wait(self._interval):
+            self.poll()
+
+    def stop(self):
+        self._stopped.set()
+        if self.is_alive():
+            self.join()